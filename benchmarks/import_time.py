@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+"""
+Import-time benchmark for OpenAudio SDK
+
+Measures the cost of ``import openaudio`` in fresh interpreters and fails
+if it exceeds the budget or pulls in the provider SDK or other heavy
+optional modules, which must only be loaded on first use.
+
+Usage:
+    python benchmarks/import_time.py [--runs N] [--budget-ms MS]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must not be imported by `import openaudio`
+FORBIDDEN = ["google", "numpy", "concurrent.futures.thread", "tempfile"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import openaudio
+client = openaudio.OpenAudioClient()
+elapsed = time.perf_counter() - start
+print(json.dumps({"ms": elapsed * 1000, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_once():
+    """Run one cold import in a subprocess"""
+    env = dict(os.environ, PYTHONPATH=ROOT, PYTHONDONTWRITEBYTECODE="1")
+    output = subprocess.check_output([sys.executable, "-c", PROBE], env=env, cwd=ROOT)
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=75.0)
+    args = parser.parse_args()
+
+    timings = []
+    loaded = set()
+    for _ in range(args.runs):
+        result = measure_once()
+        timings.append(result["ms"])
+        loaded.update(result["modules"])
+
+    median = statistics.median(timings)
+    print(f"import openaudio + client construction: "
+          f"median {median:.1f} ms, min {min(timings):.1f} ms, max {max(timings):.1f} ms "
+          f"over {args.runs} runs")
+
+    leaked = [name for name in FORBIDDEN if name in loaded]
+    if leaked:
+        print(f"FAIL: eagerly imported {', '.join(leaked)}")
+        return 1
+    if median > args.budget_ms:
+        print(f"FAIL: median exceeds budget of {args.budget_ms:.1f} ms")
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
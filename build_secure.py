@@ -37,13 +37,10 @@ def create_secure_package():
     package_dir = dist_dir / "openaudio"
     package_dir.mkdir()
     
-    # Copy Python files (will be compiled)
+    # Copy Python files (will be compiled); the obfuscator is a build-time tool
     source_files = [
-        "openaudio/__init__.py",
-        "openaudio/client.py",
-        "openaudio/models.py",
-        "openaudio/exceptions.py",
-        "openaudio/_core.py"
+        path for path in sorted(Path("openaudio").glob("*.py"))
+        if path.name != "_obfuscator.py"
     ]
     
     for source_file in source_files:
@@ -3,8 +3,31 @@ OpenAudio SDK - A modern text-to-speech SDK for Python
 """
 
 from .client import OpenAudioClient
-from .exceptions import OpenAudioError, AuthenticationError, InvalidInputError
-from .models import VoiceOptions, AudioFormat, Voice, AudioResponse
+from .exceptions import (
+    OpenAudioError,
+    AuthenticationError,
+    InvalidInputError,
+    DeadlineExceededError,
+    CancelledError
+)
+from .models import (
+    VoiceOptions,
+    AudioFormat,
+    Voice,
+    AudioResponse,
+    CacheStats,
+    WarmupStats,
+    LaneStats,
+    ModelStats,
+    DocumentRenderResult
+)
+from .cancellation import CancellationToken
+from .cache import AudioCache
+from .shared_cache import SharedAudioCache
+from .warming import CacheWarmer
+from .scheduler import Scheduler
+from .templates import PromptTemplate
+from .routing import ModelRouter
 
 __version__ = "1.0.0"
 __all__ = [
@@ -12,8 +35,22 @@ __all__ = [
     "OpenAudioError",
     "AuthenticationError",
     "InvalidInputError",
+    "DeadlineExceededError",
+    "CancelledError",
+    "CancellationToken",
     "VoiceOptions",
     "AudioFormat",
     "Voice",
-    "AudioResponse"
+    "AudioResponse",
+    "AudioCache",
+    "SharedAudioCache",
+    "CacheStats",
+    "CacheWarmer",
+    "WarmupStats",
+    "Scheduler",
+    "LaneStats",
+    "PromptTemplate",
+    "ModelRouter",
+    "ModelStats",
+    "DocumentRenderResult"
 ]
\ No newline at end of file
@@ -0,0 +1,188 @@
+"""
+Internal PCM helpers (16-bit little-endian mono)
+"""
+
+import sys
+from array import array
+from typing import List, Optional, Tuple
+
+_SAMPLE_WIDTH = 2
+_SILENCE_THRESHOLD = 500  # peak amplitude, roughly -36 dBFS
+
+_numpy = None
+_numpy_checked = False
+
+
+def _get_numpy():
+    """Import numpy on first use; it is optional and slow to import"""
+    global _numpy, _numpy_checked
+    if not _numpy_checked:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+        _numpy_checked = True
+    return _numpy
+
+
+def _frame_peaks(pcm: bytes, frame_samples: int) -> List[int]:
+    """Peak absolute amplitude of each complete frame"""
+    n_frames = len(pcm) // (_SAMPLE_WIDTH * frame_samples)
+    if n_frames == 0:
+        return []
+    usable = n_frames * frame_samples * _SAMPLE_WIDTH
+
+    np = _get_numpy()
+    if np is not None:
+        samples = np.frombuffer(pcm[:usable], dtype='<i2').astype(np.int32)
+        return np.abs(samples.reshape(n_frames, frame_samples)).max(axis=1).tolist()
+
+    samples = array('h')
+    samples.frombytes(pcm[:usable])
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    peaks = []
+    for start in range(0, len(samples), frame_samples):
+        frame = samples[start:start + frame_samples]
+        peaks.append(max(max(frame), -min(frame)))
+    return peaks
+
+
+def _find_silences(pcm: bytes,
+                   sample_rate: int,
+                   min_silence_ms: int,
+                   frame_ms: int = 10,
+                   threshold: int = _SILENCE_THRESHOLD) -> List[Tuple[int, int]]:
+    """
+    Find internal silent runs in PCM data
+
+    Returns (start, end) byte offsets of silent runs of at least
+    ``min_silence_ms``, excluding leading and trailing silence.
+    """
+    frame_samples = max(1, sample_rate * frame_ms // 1000)
+    frame_bytes = frame_samples * _SAMPLE_WIDTH
+    min_frames = max(1, min_silence_ms // frame_ms)
+    peaks = _frame_peaks(pcm, frame_samples)
+
+    runs = []
+    run_start = None
+    for i, peak in enumerate(peaks):
+        if peak < threshold:
+            if run_start is None:
+                run_start = i
+        elif run_start is not None:
+            # Leading silence is not a gap between segments
+            if run_start > 0 and i - run_start >= min_frames:
+                runs.append((run_start * frame_bytes, i * frame_bytes))
+            run_start = None
+    return runs
+
+
+def _split_on_silence(pcm: bytes,
+                      count: int,
+                      sample_rate: int,
+                      min_silence_ms: int = 400,
+                      separation: float = 1.5,
+                      keep_ms: int = 20) -> Optional[List[bytes]]:
+    """
+    Split PCM data into ``count`` segments at the longest silent gaps
+
+    The gaps themselves are dropped, apart from ``keep_ms`` of padding on
+    either side, so each segment ends and starts close to its speech.
+
+    Returns None when the split is ambiguous: fewer gaps than needed, or the
+    chosen gaps are not clearly longer (by ``separation``) than the next
+    candidate, which would mean a natural pause could be mistaken for a
+    segment boundary.
+    """
+    if count == 1:
+        return [pcm]
+
+    gaps = _find_silences(pcm, sample_rate, min_silence_ms)
+    if len(gaps) < count - 1:
+        return None
+
+    by_length = sorted(gaps, key=lambda g: g[1] - g[0], reverse=True)
+    chosen = by_length[:count - 1]
+    if len(by_length) >= count:
+        shortest_chosen = chosen[-1][1] - chosen[-1][0]
+        next_best = by_length[count - 1][1] - by_length[count - 1][0]
+        if shortest_chosen < next_best * separation:
+            return None
+
+    keep = sample_rate * keep_ms // 1000 * _SAMPLE_WIDTH
+    segments = []
+    previous = 0
+    for start, end in sorted(chosen):
+        # Padding never crosses the middle of the gap
+        middle = (start + end) // 2
+        middle -= middle % _SAMPLE_WIDTH
+        segments.append(pcm[previous:min(start + keep, middle)])
+        previous = max(end - keep, middle)
+    segments.append(pcm[previous:])
+    return segments
+
+
+def _silence(duration_ms: int, sample_rate: int) -> bytes:
+    """Generate silent PCM data"""
+    return b'\x00' * (sample_rate * duration_ms // 1000 * _SAMPLE_WIDTH)
+
+
+def _trim_silence(pcm: bytes,
+                  sample_rate: int,
+                  keep_ms: int = 20,
+                  frame_ms: int = 10,
+                  threshold: int = _SILENCE_THRESHOLD) -> bytes:
+    """Strip leading and trailing silence, keeping ``keep_ms`` of padding"""
+    frame_samples = max(1, sample_rate * frame_ms // 1000)
+    frame_bytes = frame_samples * _SAMPLE_WIDTH
+    voiced = [i for i, peak in enumerate(_frame_peaks(pcm, frame_samples)) if peak >= threshold]
+    if not voiced:
+        return pcm
+    keep = keep_ms // frame_ms
+    start = max(0, voiced[0] - keep) * frame_bytes
+    end = min(len(pcm), (voiced[-1] + 1 + keep) * frame_bytes)
+    return pcm[start:end]
+
+
+def _crossfade_join(segments: List[bytes], sample_rate: int, crossfade_ms: int) -> bytes:
+    """Concatenate PCM segments, overlapping each boundary with a linear crossfade"""
+    fade = sample_rate * crossfade_ms // 1000
+    if fade <= 0 or len(segments) < 2:
+        return b''.join(segments)
+
+    np = _get_numpy()
+    result = bytearray(segments[0])
+    for segment in segments[1:]:
+        n = min(fade, len(result) // _SAMPLE_WIDTH, len(segment) // _SAMPLE_WIDTH)
+        if n == 0:
+            result += segment
+            continue
+        tail = bytes(result[-n * _SAMPLE_WIDTH:])
+        head = segment[:n * _SAMPLE_WIDTH]
+
+        if np is not None:
+            ramp = np.linspace(0.0, 1.0, n, endpoint=False)
+            a = np.frombuffer(tail, dtype='<i2')
+            b = np.frombuffer(head, dtype='<i2')
+            mixed = np.clip(a * (1.0 - ramp) + b * ramp, -32768, 32767).astype('<i2').tobytes()
+        else:
+            a = array('h')
+            a.frombytes(tail)
+            b = array('h')
+            b.frombytes(head)
+            if sys.byteorder == 'big':
+                a.byteswap()
+                b.byteswap()
+            out = array('h', (
+                max(-32768, min(32767, int(a[i] * (n - i) / n + b[i] * i / n)))
+                for i in range(n)
+            ))
+            if sys.byteorder == 'big':
+                out.byteswap()
+            mixed = out.tobytes()
+
+        result[-n * _SAMPLE_WIDTH:] = mixed
+        result += segment[n * _SAMPLE_WIDTH:]
+    return bytes(result)
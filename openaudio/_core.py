@@ -82,7 +82,7 @@ def _get_config_builder():
     """Get configuration builder function"""
     types = _ModuleLoader.get_types()
     
-    def build_config(voice_name: str):
+    def build_config(voice_name: str, timeout=None):
         # Build config without exposing class names - all base64 encoded
         # R2VuZXJhdGVDb250ZW50Q29uZmln = base64('GenerateContentConfig')
         conf_class = getattr(types, base64.b64decode(b'R2VuZXJhdGVDb250ZW50Q29uZmln').decode())
@@ -96,6 +96,13 @@ def _get_config_builder():
         # UHJlYnVpbHRWb2ljZUNvbmZpZw== = base64('PrebuiltVoiceConfig')
         prebuilt_conf = getattr(types, base64.b64decode(b'UHJlYnVpbHRWb2ljZUNvbmZpZw==').decode())
         
+        extra = {}
+        if timeout is not None:
+            # SHR0cE9wdGlvbnM= = base64('HttpOptions')
+            http_conf = getattr(types, base64.b64decode(b'SHR0cE9wdGlvbnM=').decode())
+            # Transport timeout is expressed in milliseconds
+            extra['http_options'] = http_conf(timeout=max(1, int(timeout * 1000)))
+        
         return conf_class(
             response_modalities=[_decode(_AUDIO_MOD)],
             speech_config=speech_conf(
@@ -105,6 +112,7 @@ def _get_config_builder():
                     )
                 )
             ),
+            **extra
         )
     
     return build_config
@@ -116,16 +124,16 @@ def _create_client(api_key=None):
         return ClientClass(api_key=api_key)
     return ClientClass()
 
-def _generate_content(client, text, voice_name, system_prompt=None):
+def _generate_content(client, text, voice_name, system_prompt=None, timeout=None, model=None):
     """Generate content with obfuscated API"""
-    model = _decode(_MODEL_ID)
+    model = model or _decode(_MODEL_ID)
     
     content = text
     if system_prompt:
         content = f"{system_prompt}: {text}"
     
     config_builder = _get_config_builder()
-    config = config_builder(voice_name)
+    config = config_builder(voice_name, timeout)
     
     # Use getattr with base64 encoded names to avoid exposing API structure
     # bW9kZWxz = base64('models')
@@ -0,0 +1,102 @@
+"""
+In-process audio cache for OpenAudio SDK
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from .models import CacheStats
+
+
+def _cache_key(text: str,
+               voice_name: str,
+               system_prompt: Optional[str] = None,
+               model: Optional[str] = None) -> str:
+    """Build a stable cache key for a synthesis request"""
+    import hashlib  # deferred to keep package import cheap
+    
+    parts = (voice_name, system_prompt or "", text)
+    if model is not None:
+        parts += (model,)
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class AudioCache:
+    """Thread-safe LRU cache of synthesized PCM data, bounded by total size"""
+    
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize audio cache
+        
+        Args:
+            max_bytes: Maximum total size of cached PCM data
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached PCM data for key, or None on a miss"""
+        with self._lock:
+            pcm_data = self._entries.get(key)
+            if pcm_data is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return pcm_data
+    
+    def put(self, key: str, pcm_data: bytes) -> None:
+        """Store PCM data, evicting least recently used entries as needed"""
+        if len(pcm_data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = pcm_data
+            self._size += len(pcm_data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._evictions += 1
+    
+    def _after_fork(self) -> None:
+        """Replace the lock, which may have been held by a parent thread"""
+        self._lock = threading.Lock()
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+    
+    def stats(self) -> CacheStats:
+        """Return a snapshot of cache statistics"""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size_bytes=self._size,
+                evictions=self._evictions
+            )
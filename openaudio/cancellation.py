@@ -0,0 +1,194 @@
+"""
+Deadlines and cooperative cancellation for OpenAudio SDK
+"""
+
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from .exceptions import CancelledError, DeadlineExceededError, InvalidInputError
+
+# Transport timeout for calls that may be abandoned but have no deadline
+MAX_TRANSPORT_TIMEOUT = 300.0
+
+
+class CancellationToken:
+    """Thread-safe token used to cancel in-flight requests from another thread"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() has been called"""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel all work associated with this token"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise CancelledError if the token has been cancelled"""
+        if self._event.is_set():
+            raise CancelledError("Operation was cancelled")
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or timeout expires; returns cancelled state"""
+        return self._event.wait(timeout)
+
+    def _add_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback run on cancel (immediately if already cancelled)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def _remove_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a previously added callback"""
+        with self._lock:
+            try:
+                self._callbacks.remove(callback)
+            except ValueError:
+                pass
+
+
+class _Lease:
+    """Reference-counted hold on a resource, released when the last holder lets go"""
+
+    def __init__(self, release: Callable[[], None]):
+        self._release = release
+        self._count = 1
+        self._lock = threading.Lock()
+
+    def retain(self) -> None:
+        """Add a holder"""
+        with self._lock:
+            self._count += 1
+
+    def release(self) -> None:
+        """Drop a holder, releasing the resource if it was the last one"""
+        with self._lock:
+            self._count -= 1
+            last = self._count == 0
+        if last:
+            self._release()
+
+
+class _Budget:
+    """Time and cancellation budget threaded through a single request"""
+
+    def __init__(self,
+                 timeout: Optional[float] = None,
+                 deadline: Optional[float] = None,
+                 cancel_token: Optional[CancellationToken] = None):
+        """
+        Args:
+            timeout: Relative timeout in seconds
+            deadline: Absolute deadline as a time.monotonic() timestamp
+            cancel_token: Optional cancellation token
+        """
+        if timeout is not None:
+            if timeout <= 0:
+                raise InvalidInputError("Timeout must be positive")
+            expiry = time.monotonic() + timeout
+            deadline = expiry if deadline is None else min(deadline, expiry)
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+
+    @property
+    def bounded(self) -> bool:
+        """Whether this budget can expire or be cancelled"""
+        return self.deadline is not None or self.cancel_token is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None if unbounded"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def transport_timeout(self) -> Optional[float]:
+        """
+        Timeout to pass to the backend transport
+
+        Calls that can be abandoned (any bounded budget, including one with
+        only a cancel token) always get a finite timeout so the abandoned
+        call cannot run forever.
+        """
+        if not self.bounded:
+            return None
+        remaining = self.remaining()
+        return MAX_TRANSPORT_TIMEOUT if remaining is None else remaining
+
+    def check(self, stage: str = "request") -> None:
+        """Raise if the budget is cancelled or expired"""
+        if self.cancel_token is not None:
+            self.cancel_token.raise_if_cancelled()
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise DeadlineExceededError(f"Deadline exceeded during {stage}")
+
+    def run(self,
+            func: Callable[..., Any],
+            *args,
+            stage: str = "request",
+            lease: Optional[_Lease] = None,
+            **kwargs) -> Any:
+        """
+        Run a blocking call within the budget
+
+        Unbounded budgets call ``func`` inline. Otherwise the call runs on a
+        daemon thread and the caller returns as soon as the deadline passes or
+        the token is cancelled; the abandoned call is itself bounded by the
+        transport timeout passed down to the backend. ``lease`` is held
+        until the call actually finishes, so resources such as a scheduler
+        slot are not handed out again while an abandoned call still runs.
+        """
+        self.check(stage)
+        if not self.bounded:
+            return func(*args, **kwargs)
+
+        done = threading.Event()
+        outcome = {}
+
+        def target():
+            try:
+                outcome["result"] = func(*args, **kwargs)
+            except BaseException as e:
+                outcome["error"] = e
+            finally:
+                done.set()
+                if lease is not None:
+                    lease.release()
+
+        if lease is not None:
+            lease.retain()
+        worker = threading.Thread(target=target, name="openaudio-request", daemon=True)
+        try:
+            worker.start()
+        except BaseException:
+            if lease is not None:
+                lease.release()
+            raise
+
+        if self.cancel_token is not None:
+            self.cancel_token._add_callback(done.set)
+        try:
+            done.wait(self.remaining())
+        finally:
+            if self.cancel_token is not None:
+                self.cancel_token._remove_callback(done.set)
+
+        if "error" in outcome:
+            raise outcome["error"]
+        if "result" in outcome:
+            return outcome["result"]
+        self.check(stage)
+        raise DeadlineExceededError(f"Deadline exceeded during {stage}")
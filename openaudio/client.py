@@ -2,14 +2,59 @@
 OpenAudio Client - Core TTS functionality
 """
 
+import dataclasses
+import os
+import threading
 import wave
+import weakref
 import io
-from typing import Optional, Union
+from collections import deque
+from contextlib import contextmanager
+import time
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 from pathlib import Path
 
-from .exceptions import OpenAudioError, AuthenticationError, InvalidInputError, APIError
-from .models import VoiceOptions, AudioFormat, AudioResponse, Voice
+from .exceptions import (
+    OpenAudioError,
+    AuthenticationError,
+    InvalidInputError,
+    APIError,
+    CancelledError,
+    DeadlineExceededError
+)
+from .models import (
+    VoiceOptions,
+    AudioFormat,
+    AudioResponse,
+    Voice,
+    WarmupStats,
+    ModelStats,
+    DocumentRenderResult
+)
+from .cancellation import CancellationToken, _Budget, _Lease
+from .cache import AudioCache, _cache_key
+from .warming import CacheWarmer
+from .scheduler import Scheduler
 from ._core import _create_client, _generate_content
+from ._audio import _split_on_silence, _silence, _trim_silence, _crossfade_join
+from .markup import SpeechSegment, parse_markup
+from .routing import DEFAULT_MODEL, ModelRouter
+from .documents import _DocumentManifest, _split_sentences
+from .templates import PromptTemplate
+
+
+# Clients whose per-process state is reset in forked children
+_live_clients = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    """Reset every live client as soon as a child process starts"""
+    for client in list(_live_clients):
+        client._check_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
 
 
 class OpenAudioClient:
@@ -19,18 +64,95 @@ class OpenAudioClient:
     DEFAULT_CHANNELS = 1
     DEFAULT_SAMPLE_WIDTH = 2
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    # Instruction used when several prompts are packed into one request
+    PACK_INSTRUCTION = (
+        "Read each of the following lines as a separate sentence, "
+        "with a long pause of about one second between lines"
+    )
+    
+    # Speculative prefetches jump ahead of regular warming work
+    PREFETCH_PRIORITY = 1000
+    
+    # Size of the segment cache used for templates when no cache is configured
+    TEMPLATE_CACHE_BYTES = 64 * 1024 * 1024
+    
+    def __init__(self,
+                 api_key: Optional[str] = None,
+                 model: Optional[Union[str, ModelRouter]] = None,
+                 timeout: Optional[float] = None,
+                 cache: Optional[AudioCache] = None,
+                 scheduler: Optional[Scheduler] = None,
+                 lazy: bool = True):
         """
         Initialize OpenAudio client
         
+        The backend connection is created on first use and re-created
+        automatically in a forked child process, so a client built before
+        ``fork`` (e.g. in a pre-fork server master) is safe to use in workers.
+        
         Args:
             api_key: Optional API key for authentication
-            model: Optional model override (ignored, for compatibility)
+            model: Optional model id, or a ModelRouter for latency-aware
+                selection with automatic fallback
+            timeout: Optional default per-call timeout in seconds
+            cache: Optional cache of synthesized audio shared by all calls
+            scheduler: Optional scheduler sharing concurrency between lanes
+            lazy: Defer backend initialization until the first request
         """
-        try:
-            self._client = _create_client(api_key)
-        except Exception as e:
-            raise AuthenticationError(f"Failed to initialize client: {str(e)}")
+        self._api_key = api_key
+        self._default_timeout = timeout
+        self._cache = cache
+        self._scheduler = scheduler
+        if isinstance(model, ModelRouter):
+            self._router = model
+        else:
+            self._router = ModelRouter(model or DEFAULT_MODEL)
+        self._warmer: Optional[CacheWarmer] = None
+        self._prefetch_graph = {}
+        self._template_cache: Optional[AudioCache] = None
+        self._backend = None
+        self._pid = os.getpid()
+        self._init_lock = threading.Lock()
+        _live_clients.add(self)
+        if not lazy:
+            self._get_backend()
+    
+    def _check_fork(self) -> None:
+        """Drop per-process state inherited from a parent process"""
+        pid = os.getpid()
+        if pid != self._pid:
+            # Locks may have been held by threads that do not exist here
+            self._init_lock = threading.Lock()
+            self._backend = None
+            self._warmer = None
+            if self._cache is not None:
+                self._cache._after_fork()
+            if self._scheduler is not None:
+                self._scheduler._after_fork()
+            if self._template_cache is not None:
+                self._template_cache._after_fork()
+            self._router._after_fork()
+            self._pid = pid
+    
+    @property
+    def _client(self):
+        """Backend client, created on first use and after fork"""
+        return self._get_backend()
+    
+    def _get_backend(self):
+        """Return the backend client, creating it if needed"""
+        self._check_fork()
+        backend = self._backend
+        if backend is not None:
+            return backend
+        
+        with self._init_lock:
+            if self._backend is None:
+                try:
+                    self._backend = _create_client(self._api_key)
+                except Exception as e:
+                    raise AuthenticationError(f"Failed to initialize client: {str(e)}")
+            return self._backend
     
     def _get_voice_name(self, voice: Voice) -> str:
         """Get voice name mapped to internal API"""
@@ -45,7 +167,7 @@ class OpenAudioClient:
         }
         return voice_map.get(voice.value, "Kore")
     
-    def _create_wave_data(self, pcm_data: bytes) -> bytes:
+    def _create_wave_data(self, pcm_data: Union[bytes, memoryview]) -> bytes:
         """Convert PCM data to WAV format"""
         wav_buffer = io.BytesIO()
         with wave.open(wav_buffer, 'wb') as wf:
@@ -55,11 +177,250 @@ class OpenAudioClient:
             wf.writeframes(pcm_data)
         return wav_buffer.getvalue()
     
+    def _write_wave_file(self, output_path: Path, pcm_data: Union[bytes, memoryview, Iterable[bytes]],
+                         budget: Optional[_Budget] = None) -> None:
+        """Atomically write PCM data (bytes or an iterable of chunks) as a WAV file"""
+        import tempfile  # deferred to keep package import cheap
+        
+        budget = budget or _Budget()
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f".{output_path.name}.", suffix=".tmp", dir=str(output_path.parent)
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                with wave.open(f, 'wb') as wf:
+                    wf.setnchannels(self.DEFAULT_CHANNELS)
+                    wf.setsampwidth(self.DEFAULT_SAMPLE_WIDTH)
+                    wf.setframerate(self.DEFAULT_SAMPLE_RATE)
+                    if isinstance(pcm_data, (bytes, bytearray, memoryview)):
+                        pcm_data = [pcm_data]
+                    for chunk in pcm_data:
+                        wf.writeframes(chunk)
+            budget.check("file write")
+            os.replace(tmp_path, str(output_path))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _make_budget(self,
+                     timeout: Optional[float] = None,
+                     deadline: Optional[float] = None,
+                     cancel_token: Optional[CancellationToken] = None) -> _Budget:
+        """Build the time/cancellation budget for one call"""
+        if timeout is None:
+            timeout = self._default_timeout
+        return _Budget(timeout, deadline, cancel_token)
+    
+    @property
+    def cache(self) -> Optional[AudioCache]:
+        """Audio cache used by this client, if any"""
+        return self._cache
+    
+    @property
+    def scheduler(self) -> Optional[Scheduler]:
+        """Request scheduler used by this client, if any"""
+        return self._scheduler
+    
+    @property
+    def router(self) -> ModelRouter:
+        """Model router used by this client"""
+        return self._router
+    
+    def model_stats(self) -> Dict[str, ModelStats]:
+        """Return rolling latency and error statistics per model"""
+        return self._router.stats()
+    
+    def _cache_key_for(self,
+                       text: str,
+                       voice_options: VoiceOptions,
+                       system_prompt: Optional[str] = None,
+                       model: Optional[str] = None) -> str:
+        """Cache key of a synthesis request, keyed by the requested model"""
+        model = model or self._router.primary
+        return _cache_key(
+            text,
+            self._get_voice_name(voice_options.voice),
+            system_prompt,
+            None if model == DEFAULT_MODEL else model
+        )
+    
+    def _synthesize_pcm(self,
+                        text: str,
+                        voice_options: VoiceOptions,
+                        system_prompt: Optional[str] = None,
+                        budget: Optional[_Budget] = None,
+                        lane: Optional[str] = None,
+                        cache: Optional[AudioCache] = None,
+                        model: Optional[str] = None) -> bytes:
+        """Return PCM data for a request, served from the cache when possible"""
+        cache = cache if cache is not None else self._cache
+        if cache is None:
+            return self._request_pcm(text, voice_options, system_prompt, budget, lane, model)
+        
+        key = self._cache_key_for(text, voice_options, system_prompt, model)
+        pcm_data = cache.get(key)
+        if pcm_data is None:
+            pcm_data = self._request_pcm(text, voice_options, system_prompt, budget, lane, model)
+            cache.put(key, pcm_data)
+        return pcm_data
+    
+    @contextmanager
+    def _pcm_view(self,
+                  text: str,
+                  voice_options: VoiceOptions,
+                  system_prompt: Optional[str] = None,
+                  budget: Optional[_Budget] = None,
+                  lane: Optional[str] = None,
+                  model: Optional[str] = None) -> Iterator[Union[bytes, memoryview]]:
+        """
+        PCM data for a request, valid inside the ``with`` block
+        
+        Hits on a cache offering zero-copy views (SharedAudioCache) are
+        served straight from the cache without copying.
+        """
+        view = getattr(self._cache, "view", None)
+        if view is None:
+            yield self._synthesize_pcm(text, voice_options, system_prompt, budget, lane, model=model)
+            return
+        
+        key = self._cache_key_for(text, voice_options, system_prompt, model)
+        with view(key) as cached:
+            if cached is not None:
+                yield cached
+                return
+        pcm_data = self._request_pcm(text, voice_options, system_prompt, budget, lane, model)
+        self._cache.put(key, pcm_data)
+        yield pcm_data
+    
+    def _synthesize_segments(self,
+                             requests: List[Tuple[str, VoiceOptions]],
+                             system_prompt: Optional[str],
+                             budget: _Budget,
+                             lane: Optional[str] = None,
+                             max_in_flight: int = 4,
+                             cache: Optional[AudioCache] = None,
+                             model: Optional[str] = None) -> List[bytes]:
+        """Synthesize segments in parallel, rendering identical ones only once"""
+        if max_in_flight < 1:
+            raise InvalidInputError("max_in_flight must be at least 1")
+        
+        keys = [
+            self._cache_key_for(text, options, system_prompt, model)
+            for text, options in requests
+        ]
+        unique = dict(zip(keys, requests))
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=min(max_in_flight, len(unique))) as executor:
+            futures = {
+                key: executor.submit(
+                    self._synthesize_pcm, text, options, system_prompt, budget, lane, cache, model
+                )
+                for key, (text, options) in unique.items()
+            }
+            try:
+                rendered = {key: future.result() for key, future in futures.items()}
+            finally:
+                for future in futures.values():
+                    future.cancel()
+        
+        return [rendered[key] for key in keys]
+    
+    def _request_pcm(self,
+                     text: str,
+                     voice_options: VoiceOptions,
+                     system_prompt: Optional[str] = None,
+                     budget: Optional[_Budget] = None,
+                     lane: Optional[str] = None,
+                     model: Optional[str] = None) -> bytes:
+        """Run a single synthesis request and return raw PCM data"""
+        budget = budget or _Budget()
+        if self._scheduler is None:
+            return self._route_request(text, voice_options, system_prompt, budget, model)
+        # The slot is held until the backend call finishes, even if abandoned
+        lease = self._scheduler._lease(lane, voice_options.voice, budget)
+        try:
+            return self._route_request(text, voice_options, system_prompt, budget, model, lease)
+        finally:
+            lease.release()
+    
+    def _route_request(self,
+                       text: str,
+                       voice_options: VoiceOptions,
+                       system_prompt: Optional[str],
+                       budget: _Budget,
+                       model: Optional[str] = None,
+                       lease: Optional[_Lease] = None) -> bytes:
+        """Send a request to the selected model, falling back on errors"""
+        if model is not None:
+            return self._run_request(text, voice_options, system_prompt, budget, model, lease)
+        
+        tried = []
+        while True:
+            selected = self._router.select(exclude=tried)
+            try:
+                return self._run_request(text, voice_options, system_prompt, budget, selected, lease)
+            except (AuthenticationError, CancelledError, DeadlineExceededError):
+                raise
+            except Exception:
+                tried.append(selected)
+                if len(tried) >= len(self._router.chain):
+                    raise
+    
+    def _run_request(self,
+                     text: str,
+                     voice_options: VoiceOptions,
+                     system_prompt: Optional[str],
+                     budget: _Budget,
+                     model: str,
+                     lease: Optional[_Lease] = None) -> bytes:
+        """Call the backend within the request budget and record model health"""
+        # Initialization errors say nothing about the model's health
+        backend = self._client
+        start = time.monotonic()
+        try:
+            pcm_data = budget.run(
+                _generate_content,
+                backend,
+                text,
+                self._get_voice_name(voice_options.voice),
+                system_prompt,
+                budget.transport_timeout(),
+                None if model == DEFAULT_MODEL else model,
+                stage="request",
+                lease=lease
+            )
+            if not pcm_data:
+                raise APIError("No audio data received")
+        except CancelledError:
+            raise
+        except DeadlineExceededError:
+            # An expired budget is not a model error, only a latency signal
+            elapsed = time.monotonic() - start
+            if elapsed > self._router.p95_threshold:
+                self._router.record(model, elapsed, success=True)
+            raise
+        except Exception:
+            self._router.record(model, time.monotonic() - start, success=False)
+            raise
+        
+        self._router.record(model, time.monotonic() - start, success=True)
+        return pcm_data
+    
     def generate_speech(self,
                        text: str,
                        voice_options: Optional[VoiceOptions] = None,
                        output_format: AudioFormat = AudioFormat.WAV,
-                       system_prompt: Optional[str] = None) -> AudioResponse:
+                       system_prompt: Optional[str] = None,
+                       timeout: Optional[float] = None,
+                       deadline: Optional[float] = None,
+                       cancel_token: Optional[CancellationToken] = None,
+                       lane: Optional[str] = None,
+                       model: Optional[str] = None) -> AudioResponse:
         """
         Generate speech from text
         
@@ -68,28 +429,30 @@ class OpenAudioClient:
             voice_options: Voice configuration options
             output_format: Output audio format
             system_prompt: Optional system instruction
+            timeout: Optional timeout in seconds for the whole call
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the call from another thread
+            lane: Optional scheduler lane (e.g. "interactive" or "bulk")
+            model: Optional model for this call, bypassing automatic fallback
         
         Returns:
             AudioResponse containing audio data
+        
+        Raises:
+            DeadlineExceededError: If the timeout or deadline expires
+            CancelledError: If the cancel token is cancelled
         """
         if not text:
             raise InvalidInputError("Text input cannot be empty")
         
         voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
         
         try:
-            # Use obfuscated core
-            pcm_data = _generate_content(
-                self._client,
-                text,
-                self._get_voice_name(voice_options.voice),
-                system_prompt
-            )
-            
-            if not pcm_data:
-                raise APIError("No audio data received")
-            
-            audio_data = self._create_wave_data(pcm_data)
+            with self._pcm_view(text, voice_options, system_prompt, budget, lane, model) as pcm_data:
+                self._prefetch_next(text, voice_options, system_prompt)
+                audio_data = self._create_wave_data(pcm_data)
+            budget.check("post-processing")
             
             return AudioResponse(
                 audio_data=audio_data,
@@ -107,16 +470,30 @@ class OpenAudioClient:
                               output_path: Union[str, Path],
                               voice_options: Optional[VoiceOptions] = None,
                               output_format: AudioFormat = AudioFormat.WAV,
-                              system_prompt: Optional[str] = None) -> str:
+                              system_prompt: Optional[str] = None,
+                              timeout: Optional[float] = None,
+                              deadline: Optional[float] = None,
+                              cancel_token: Optional[CancellationToken] = None,
+                              lane: Optional[str] = None,
+                              model: Optional[str] = None) -> str:
         """
         Generate speech and save to file
         
+        The file is written to a temporary path and only moved into place if
+        the call is still within its deadline, so expired or cancelled calls
+        never leave partial output behind.
+        
         Args:
             text: Text to convert to speech
             output_path: Path to save audio file
             voice_options: Voice configuration options
             output_format: Output audio format
             system_prompt: Optional system instruction
+            timeout: Optional timeout in seconds for the whole call
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the call from another thread
+            lane: Optional scheduler lane (e.g. "interactive" or "bulk")
+            model: Optional model for this call, bypassing automatic fallback
         
         Returns:
             Path to saved file
@@ -125,28 +502,635 @@ class OpenAudioClient:
             raise InvalidInputError("Text input cannot be empty")
         
         voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            # Use obfuscated core
-            pcm_data = _generate_content(
-                self._client,
-                text,
-                self._get_voice_name(voice_options.voice),
-                system_prompt
+            with self._pcm_view(text, voice_options, system_prompt, budget, lane, model) as pcm_data:
+                self._prefetch_next(text, voice_options, system_prompt)
+                self._write_wave_file(output_path, pcm_data, budget)
+            
+            return str(output_path)
+            
+        except Exception as e:
+            if isinstance(e, OpenAudioError):
+                raise
+            raise APIError(f"Failed to generate speech: {str(e)}")
+    
+    def synthesize_iter(self,
+                        texts: Iterable[str],
+                        max_in_flight: int = 4,
+                        ordered: bool = False,
+                        voice_options: Optional[VoiceOptions] = None,
+                        output_format: AudioFormat = AudioFormat.WAV,
+                        system_prompt: Optional[str] = None,
+                        timeout: Optional[float] = None,
+                        deadline: Optional[float] = None,
+                        cancel_token: Optional[CancellationToken] = None,
+                        lane: Optional[str] = None,
+                        model: Optional[str] = None) -> Iterator[AudioResponse]:
+        """
+        Synthesize a (possibly unbounded) stream of texts
+        
+        Input is pulled lazily: a new text is only taken from ``texts`` when
+        fewer than ``max_in_flight`` requests are pending, so a slow consumer
+        of this generator also slows down consumption of the input and memory
+        stays bounded regardless of stream length.
+        
+        Args:
+            texts: Iterable of texts to convert to speech
+            max_in_flight: Maximum number of concurrent requests
+            ordered: Yield results in input order instead of completion order
+            voice_options: Voice configuration options
+            output_format: Output audio format
+            system_prompt: Optional system instruction
+            timeout: Optional per-request timeout in seconds
+            deadline: Optional absolute deadline for the whole stream
+            cancel_token: Optional token that stops the stream and aborts
+                in-flight requests
+            lane: Optional scheduler lane for all requests of the stream
+            model: Optional model for this call, bypassing automatic fallback
+        
+        Returns:
+            Iterator yielding an AudioResponse for each input text
+        """
+        if max_in_flight < 1:
+            raise InvalidInputError("max_in_flight must be at least 1")
+        # Each request builds its own budget; this one only validates timeout
+        self._make_budget(timeout, deadline, cancel_token)
+        
+        # Validation above runs at call time; the generator below runs lazily
+        return self._synthesize_stream(
+            texts,
+            max_in_flight,
+            ordered,
+            cancel_token,
+            (voice_options, output_format, system_prompt, timeout, deadline, cancel_token, lane, model)
+        )
+    
+    def _synthesize_stream(self,
+                           texts: Iterable[str],
+                           max_in_flight: int,
+                           ordered: bool,
+                           cancel_token: Optional[CancellationToken],
+                           request_args: tuple) -> Iterator[AudioResponse]:
+        """Generator behind synthesize_iter"""
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+        
+        source = iter(texts)
+        pending = deque()
+        exhausted = False
+        
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            try:
+                while True:
+                    if cancel_token is not None:
+                        cancel_token.raise_if_cancelled()
+                    
+                    while not exhausted and len(pending) < max_in_flight:
+                        try:
+                            text = next(source)
+                        except StopIteration:
+                            exhausted = True
+                            break
+                        pending.append(executor.submit(
+                            self.generate_speech, text, *request_args
+                        ))
+                    
+                    if not pending:
+                        return
+                    
+                    if ordered:
+                        future = pending.popleft()
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        future = next(f for f in pending if f in done)
+                        pending.remove(future)
+                    
+                    yield future.result()
+            finally:
+                # Generator closed early or a request failed: drop queued work
+                for future in pending:
+                    future.cancel()
+    
+    def _synthesize_packed(self,
+                           texts: List[str],
+                           voice_options: VoiceOptions,
+                           system_prompt: Optional[str],
+                           budget: _Budget,
+                           lane: Optional[str] = None,
+                           model: Optional[str] = None) -> List[bytes]:
+        """Synthesize several texts in one request and split the audio"""
+        results: List[Optional[bytes]] = [None] * len(texts)
+        if self._cache is not None:
+            for i, text in enumerate(texts):
+                results[i] = self._cache.get(
+                    self._cache_key_for(text, voice_options, system_prompt, model)
+                )
+        missing = [i for i, pcm_data in enumerate(results) if pcm_data is None]
+        
+        if len(missing) > 1:
+            instruction = self.PACK_INSTRUCTION
+            if system_prompt:
+                instruction = f"{system_prompt}. {instruction}"
+            lines = "\n".join(" ".join(texts[i].split()) for i in missing)
+            pcm_data = self._request_pcm(lines, voice_options, instruction, budget, lane, model)
+            segments = _split_on_silence(pcm_data, len(missing), self.DEFAULT_SAMPLE_RATE)
+            if segments is not None:
+                for i, segment in zip(missing, segments):
+                    results[i] = segment
+                    if self._cache is not None:
+                        key = self._cache_key_for(texts[i], voice_options, system_prompt, model)
+                        self._cache.put(key, segment)
+                missing = []
+        
+        # Single prompt or ambiguous split: fall back to individual calls,
+        # without a second lookup for texts already counted as misses
+        for i in missing:
+            results[i] = self._request_pcm(
+                texts[i], voice_options, system_prompt, budget, lane, model
             )
+            if self._cache is not None:
+                key = self._cache_key_for(texts[i], voice_options, system_prompt, model)
+                self._cache.put(key, results[i])
+        return results
+    
+    def generate_speech_batch(self,
+                              texts: List[str],
+                              voice_options: Optional[VoiceOptions] = None,
+                              output_format: AudioFormat = AudioFormat.WAV,
+                              system_prompt: Optional[str] = None,
+                              pack: bool = True,
+                              max_pack_size: int = 8,
+                              max_pack_chars: int = 400,
+                              max_in_flight: int = 4,
+                              timeout: Optional[float] = None,
+                              deadline: Optional[float] = None,
+                              cancel_token: Optional[CancellationToken] = None,
+                              lane: Optional[str] = None,
+                              model: Optional[str] = None) -> List[AudioResponse]:
+        """
+        Generate speech for many texts with the same voice
+        
+        With ``pack`` enabled, short texts are combined into a single request
+        separated by pauses, and the returned audio is split back into one
+        segment per text at the detected silences. If the number of segments
+        cannot be determined unambiguously, the texts of that pack are
+        synthesized individually instead.
+        
+        Args:
+            texts: Texts to convert to speech
+            voice_options: Voice configuration options
+            output_format: Output audio format
+            system_prompt: Optional system instruction
+            pack: Combine short texts into shared requests
+            max_pack_size: Maximum number of texts per packed request
+            max_pack_chars: Maximum total characters per packed request;
+                longer texts are always synthesized on their own
+            max_in_flight: Maximum number of concurrent requests
+            timeout: Optional timeout in seconds for the whole batch
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the batch
+            lane: Optional scheduler lane for all requests of the batch
+            model: Optional model for this call, bypassing automatic fallback
+        
+        Returns:
+            AudioResponse for each text, in input order
+        """
+        if any(not text for text in texts):
+            raise InvalidInputError("Text input cannot be empty")
+        if max_pack_size < 1 or max_in_flight < 1:
+            raise InvalidInputError("max_pack_size and max_in_flight must be at least 1")
+        
+        voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
+        
+        packs = []
+        current = []
+        current_chars = 0
+        for index, text in enumerate(texts):
+            limit = max_pack_size if pack else 1
+            if current and (len(current) >= limit or
+                            current_chars + len(text) > max_pack_chars):
+                packs.append(current)
+                current, current_chars = [], 0
+            current.append(index)
+            current_chars += len(text)
+        if current:
+            packs.append(current)
+        
+        pcm_segments: List[Optional[bytes]] = [None] * len(texts)
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+                futures = {
+                    executor.submit(
+                        self._synthesize_packed,
+                        [texts[i] for i in indices],
+                        voice_options,
+                        system_prompt,
+                        budget,
+                        lane,
+                        model
+                    ): indices
+                    for indices in packs
+                }
+                try:
+                    for future, indices in futures.items():
+                        for index, pcm_data in zip(indices, future.result()):
+                            pcm_segments[index] = pcm_data
+                finally:
+                    for future in futures:
+                        future.cancel()
             
-            # Save to file
-            with wave.open(str(output_path), 'wb') as wf:
-                wf.setnchannels(self.DEFAULT_CHANNELS)
-                wf.setsampwidth(self.DEFAULT_SAMPLE_WIDTH)
-                wf.setframerate(self.DEFAULT_SAMPLE_RATE)
-                wf.writeframes(pcm_data)
+            budget.check("post-processing")
+            return [
+                AudioResponse(
+                    audio_data=self._create_wave_data(pcm_data),
+                    format=output_format,
+                    text=text
+                )
+                for text, pcm_data in zip(texts, pcm_segments)
+            ]
             
-            return str(output_path)
+        except Exception as e:
+            if isinstance(e, OpenAudioError):
+                raise
+            raise APIError(f"Failed to generate speech: {str(e)}")
+    
+    def _get_warmer(self) -> CacheWarmer:
+        """Return the background warmer, creating it on first use"""
+        if self._cache is None:
+            raise InvalidInputError("Cache warming requires a client created with a cache")
+        self._check_fork()
+        if self._warmer is None:
+            self._warmer = CacheWarmer(self)
+        return self._warmer
+    
+    def _prefetch_next(self,
+                       text: str,
+                       voice_options: VoiceOptions,
+                       system_prompt: Optional[str]) -> None:
+        """Speculatively warm the prompts likely to follow ``text``"""
+        successors = self._prefetch_graph.get(text)
+        if not successors or self._cache is None:
+            return
+        warmer = self._get_warmer()
+        for next_text in successors:
+            warmer.submit(next_text, voice_options, system_prompt,
+                          priority=self.PREFETCH_PRIORITY, prefetch=True)
+    
+    def warm_cache(self,
+                   prompts: Union[Iterable[Union[str, Tuple[str, int]]], Mapping[str, Iterable[str]]],
+                   voice_options: Optional[VoiceOptions] = None,
+                   system_prompt: Optional[str] = None,
+                   priority: int = 0,
+                   rate: Optional[float] = None,
+                   prefetch: bool = True) -> CacheWarmer:
+        """
+        Synthesize known prompts into the cache in the background
+        
+        ``prompts`` is either a list of texts, a list of ``(text, priority)``
+        pairs, or a prompt graph mapping each prompt to the prompts that
+        usually follow it. Graph prompts are warmed breadth-first, roots
+        first, and with ``prefetch`` enabled the graph is also used to
+        speculatively warm the successors of every prompt requested through
+        this client.
+        
+        Args:
+            prompts: Prompt list or prompt graph
+            voice_options: Voice configuration options
+            system_prompt: Optional system instruction
+            priority: Base priority; higher values are warmed first
+            rate: Optional maximum warming requests per second
+            prefetch: Register a prompt graph for speculative prefetch
+        
+        Returns:
+            The client's CacheWarmer, for progress tracking
+        """
+        warmer = self._get_warmer()
+        if rate is not None:
+            warmer.rate = rate
+        
+        if isinstance(prompts, Mapping):
+            if prefetch:
+                for text, successors in prompts.items():
+                    self._prefetch_graph.setdefault(text, [])
+                    for next_text in successors:
+                        if next_text not in self._prefetch_graph[text]:
+                            self._prefetch_graph[text].append(next_text)
+            
+            # Breadth-first from prompts nobody leads to, so menu roots come first
+            children = {c for successors in prompts.values() for c in successors}
+            frontier = [p for p in prompts if p not in children] or list(prompts)
+            seen = set()
+            depth = 0
+            while frontier:
+                next_frontier = []
+                for text in frontier:
+                    if text in seen:
+                        continue
+                    seen.add(text)
+                    warmer.submit(text, voice_options, system_prompt, priority - depth)
+                    next_frontier.extend(prompts.get(text, ()))
+                frontier = next_frontier
+                depth += 1
+        else:
+            for item in prompts:
+                if isinstance(item, tuple):
+                    text, item_priority = item
+                else:
+                    text, item_priority = item, priority
+                warmer.submit(text, voice_options, system_prompt, item_priority)
+        
+        return warmer
+    
+    def warmup_stats(self) -> WarmupStats:
+        """Return cache warming progress"""
+        if self._warmer is None:
+            return WarmupStats()
+        return self._warmer.stats()
+    
+    def generate_speech_markup(self,
+                               markup: str,
+                               voice_options: Optional[VoiceOptions] = None,
+                               output_format: AudioFormat = AudioFormat.WAV,
+                               system_prompt: Optional[str] = None,
+                               max_in_flight: int = 4,
+                               timeout: Optional[float] = None,
+                               deadline: Optional[float] = None,
+                               cancel_token: Optional[CancellationToken] = None,
+                               lane: Optional[str] = None,
+                               model: Optional[str] = None) -> AudioResponse:
+        """
+        Generate speech from SSML-lite markup
+        
+        The markup is parsed into a plan of speech and break segments.
+        Breaks are rendered locally as silence, identical speech segments are
+        synthesized only once, and the remaining segments are requested in
+        parallel before being assembled into a single response. See
+        ``openaudio.markup`` for the supported elements.
+        
+        Args:
+            markup: Markup text, e.g. ``Hello <break time="500ms"/> world``
+            voice_options: Voice configuration options; the voice is the
+                default outside ``<voice>`` elements
+            output_format: Output audio format
+            system_prompt: Optional system instruction
+            max_in_flight: Maximum number of concurrent segment requests
+            timeout: Optional timeout in seconds for the whole call
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the call from another thread
+            lane: Optional scheduler lane for the segment requests
+            model: Optional model for this call, bypassing automatic fallback
+        
+        Returns:
+            AudioResponse containing the assembled audio
+        """
+        if not markup or not markup.strip():
+            raise InvalidInputError("Text input cannot be empty")
+        
+        voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
+        plan = parse_markup(markup, voice_options.voice)
+        
+        speech = [s for s in plan if isinstance(s, SpeechSegment)]
+        if not speech:
+            raise InvalidInputError("Markup contains no text to synthesize")
+        
+        try:
+            rendered = iter(self._synthesize_segments(
+                [(s.text, dataclasses.replace(voice_options, voice=s.voice)) for s in speech],
+                system_prompt,
+                budget,
+                lane,
+                max_in_flight,
+                model=model
+            ))
+            
+            pcm_data = b"".join(
+                next(rendered) if isinstance(segment, SpeechSegment)
+                else _silence(segment.duration_ms, self.DEFAULT_SAMPLE_RATE)
+                for segment in plan
+            )
+            audio_data = self._create_wave_data(pcm_data)
+            budget.check("post-processing")
+            
+            return AudioResponse(
+                audio_data=audio_data,
+                format=output_format,
+                text=markup
+            )
             
         except Exception as e:
             if isinstance(e, OpenAudioError):
                 raise
-            raise APIError(f"Failed to generate speech: {str(e)}")
\ No newline at end of file
+            raise APIError(f"Failed to generate speech: {str(e)}")
+    
+    def _get_template_cache(self) -> AudioCache:
+        """Cache for template segments: the client cache or a private one"""
+        if self._cache is not None:
+            return self._cache
+        if self._template_cache is None:
+            self._template_cache = AudioCache(self.TEMPLATE_CACHE_BYTES)
+        return self._template_cache
+    
+    def generate_from_template(self,
+                               template: Union[PromptTemplate, str],
+                               values: Mapping[str, object],
+                               voice_options: Optional[VoiceOptions] = None,
+                               output_format: AudioFormat = AudioFormat.WAV,
+                               system_prompt: Optional[str] = None,
+                               max_in_flight: int = 4,
+                               timeout: Optional[float] = None,
+                               deadline: Optional[float] = None,
+                               cancel_token: Optional[CancellationToken] = None,
+                               lane: Optional[str] = None,
+                               model: Optional[str] = None) -> AudioResponse:
+        """
+        Generate speech from a template with slot values
+        
+        Static parts of the template and slot values are synthesized as
+        separate pieces and cached per voice, so repeated templates only
+        synthesize values that have not been seen before. The pieces are
+        trimmed of surrounding silence and joined with short crossfades.
+        
+        Args:
+            template: PromptTemplate or template string, e.g.
+                ``"Your order {id} will arrive on {date}"``
+            values: Slot values
+            voice_options: Voice configuration options
+            output_format: Output audio format
+            system_prompt: Optional system instruction
+            max_in_flight: Maximum number of concurrent piece requests
+            timeout: Optional timeout in seconds for the whole call
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the call from another thread
+            lane: Optional scheduler lane for the piece requests
+            model: Optional model for this call, bypassing automatic fallback
+        
+        Returns:
+            AudioResponse containing the assembled audio
+        """
+        if not isinstance(template, PromptTemplate):
+            template = PromptTemplate(template)
+        
+        voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
+        pieces = template.render_parts(values)
+        if not pieces:
+            raise InvalidInputError("Template renders to no text to synthesize")
+        
+        try:
+            rendered = self._synthesize_segments(
+                [(text, voice_options) for text, _ in pieces],
+                system_prompt,
+                budget,
+                lane,
+                max_in_flight,
+                self._get_template_cache(),
+                model
+            )
+            
+            pcm_data = _crossfade_join(
+                [_trim_silence(segment, self.DEFAULT_SAMPLE_RATE) for segment in rendered],
+                self.DEFAULT_SAMPLE_RATE,
+                template.crossfade_ms
+            )
+            audio_data = self._create_wave_data(pcm_data)
+            budget.check("post-processing")
+            
+            return AudioResponse(
+                audio_data=audio_data,
+                format=output_format,
+                text=template.format(values)
+            )
+            
+        except Exception as e:
+            if isinstance(e, OpenAudioError):
+                raise
+            raise APIError(f"Failed to generate speech: {str(e)}")
+    
+    def generate_document_to_file(self,
+                                  text: str,
+                                  output_path: Union[str, Path],
+                                  voice_options: Optional[VoiceOptions] = None,
+                                  output_format: AudioFormat = AudioFormat.WAV,
+                                  system_prompt: Optional[str] = None,
+                                  paragraph_pause_ms: int = 400,
+                                  max_in_flight: int = 4,
+                                  timeout: Optional[float] = None,
+                                  deadline: Optional[float] = None,
+                                  cancel_token: Optional[CancellationToken] = None,
+                                  lane: Optional[str] = None,
+                                  model: Optional[str] = None) -> DocumentRenderResult:
+        """
+        Render a long document to file, re-synthesizing only what changed
+        
+        The document is split into sentences, and a manifest of sentence
+        hashes is kept next to the output file (``<output>.manifest.json``)
+        together with each sentence's audio (``<output>.segments/``). When
+        a new revision is rendered to the same path, sentences whose audio
+        is already stored are reused and only changed or inserted
+        sentences are synthesized. Changing the voice, system prompt or
+        model changes every hash, so the whole document is re-rendered.
+        Each sentence is stored as soon as it is synthesized, so a render
+        that fails or is cancelled part way resumes where it stopped.
+        
+        Args:
+            text: Document text; blank lines separate paragraphs
+            output_path: Path to save audio file
+            voice_options: Voice configuration options
+            output_format: Output audio format
+            system_prompt: Optional system instruction
+            paragraph_pause_ms: Silence inserted between paragraphs
+            max_in_flight: Maximum number of concurrent sentence requests
+            timeout: Optional timeout in seconds for the whole render
+            deadline: Optional absolute deadline (time.monotonic() timestamp)
+            cancel_token: Optional token to cancel the render
+            lane: Optional scheduler lane for the sentence requests
+            model: Optional model for this call, bypassing automatic fallback
+        
+        Returns:
+            DocumentRenderResult with counts of reused and synthesized sentences
+        """
+        if not text or not text.strip():
+            raise InvalidInputError("Text input cannot be empty")
+        if paragraph_pause_ms < 0:
+            raise InvalidInputError("paragraph_pause_ms cannot be negative")
+        if max_in_flight < 1:
+            raise InvalidInputError("max_in_flight must be at least 1")
+        
+        voice_options = voice_options or VoiceOptions()
+        budget = self._make_budget(timeout, deadline, cancel_token)
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        sentences = _split_sentences(text)
+        keys = [
+            self._cache_key_for(sentence, voice_options, system_prompt, model)
+            for _, sentence in sentences
+        ]
+        manifest = _DocumentManifest(output_path).load()
+        
+        # Reuse every stored sentence: from the previous revision, or from
+        # an earlier render of this revision that did not finish
+        stored = {key for key in set(keys) if manifest.has_segment(key)}
+        missing = dict.fromkeys(
+            (key, sentence) for key, (_, sentence) in zip(keys, sentences)
+            if key not in stored
+        )
+        
+        def render(key: str, sentence: str) -> None:
+            pcm_data = self._synthesize_pcm(
+                sentence, voice_options, system_prompt, budget, lane, model=model
+            )
+            manifest.write_segment(key, pcm_data)
+        
+        try:
+            if missing:
+                from concurrent.futures import ThreadPoolExecutor
+                
+                with ThreadPoolExecutor(max_workers=min(max_in_flight, len(missing))) as executor:
+                    futures = [
+                        executor.submit(render, key, sentence) for key, sentence in missing
+                    ]
+                    try:
+                        for future in futures:
+                            future.result()
+                    finally:
+                        for future in futures:
+                            future.cancel()
+            budget.check("post-processing")
+            
+            def chunks() -> Iterator[bytes]:
+                pause = _silence(paragraph_pause_ms, self.DEFAULT_SAMPLE_RATE)
+                last_paragraph = None
+                for (paragraph, _), key in zip(sentences, keys):
+                    if last_paragraph is not None and paragraph != last_paragraph:
+                        yield pause
+                    last_paragraph = paragraph
+                    pcm_data = manifest.read_segment(key)
+                    if pcm_data is None:
+                        raise APIError("Document segment disappeared during render")
+                    yield pcm_data
+            
+            self._write_wave_file(output_path, chunks(), budget)
+            manifest.save(keys)
+            removed = manifest.prune(keys)
+            
+            return DocumentRenderResult(
+                path=str(output_path),
+                sentences=len(sentences),
+                reused=sum(1 for key in keys if key in stored),
+                synthesized=len(missing),
+                removed=removed
+            )
+            
+        except Exception as e:
+            if isinstance(e, OpenAudioError):
+                raise
+            raise APIError(f"Failed to generate speech: {str(e)}")
@@ -0,0 +1,106 @@
+"""
+Sentence-level manifests for incremental document rendering
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+_MANIFEST_VERSION = 1
+
+_PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+_SENTENCE_END = re.compile(r'(?<=[.!?…])["\'”’)\]]*\s+')
+
+# Abbreviations that end in a period without ending the sentence
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "e.g.", "i.e.", "no."}
+
+
+def _split_sentences(text: str) -> List[Tuple[int, str]]:
+    """
+    Split a document into sentences
+
+    Returns ``(paragraph index, sentence)`` pairs with whitespace normalized.
+    """
+    sentences = []
+    for paragraph_index, paragraph in enumerate(_PARAGRAPH_BREAK.split(text.strip())):
+        start = 0
+        for match in _SENTENCE_END.finditer(paragraph):
+            words = paragraph[start:match.start()].split()
+            if words and words[-1].lower() in _ABBREVIATIONS:
+                continue
+            sentences.append((paragraph_index, paragraph[start:match.end()]))
+            start = match.end()
+        sentences.append((paragraph_index, paragraph[start:]))
+    return [
+        (paragraph_index, " ".join(sentence.split()))
+        for paragraph_index, sentence in sentences
+        if sentence.strip()
+    ]
+
+
+class _DocumentManifest:
+    """Sentence hashes of a rendered document and their stored PCM segments"""
+
+    def __init__(self, output_path: Path):
+        self.output_path = output_path
+        self.path = output_path.with_name(output_path.name + ".manifest.json")
+        self.segments_dir = output_path.with_name(output_path.name + ".segments")
+        self.hashes: List[str] = []
+
+    def load(self) -> "_DocumentManifest":
+        """Read the manifest; a missing or unreadable one is treated as empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == _MANIFEST_VERSION:
+                self.hashes = [str(h) for h in data.get("segments", [])]
+        except (OSError, ValueError, AttributeError):
+            self.hashes = []
+        return self
+
+    def save(self, hashes: List[str]) -> None:
+        """Atomically write the manifest"""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": _MANIFEST_VERSION, "segments": hashes}, f)
+        os.replace(tmp_path, self.path)
+        self.hashes = list(hashes)
+
+    def _segment_path(self, key: str) -> Path:
+        return self.segments_dir / f"{key}.pcm"
+
+    def has_segment(self, key: str) -> bool:
+        """Whether PCM is stored for a sentence hash"""
+        return self._segment_path(key).is_file()
+
+    def read_segment(self, key: str) -> Optional[bytes]:
+        """Stored PCM for a sentence hash, or None"""
+        try:
+            return self._segment_path(key).read_bytes()
+        except OSError:
+            return None
+
+    def write_segment(self, key: str, pcm_data: bytes) -> None:
+        """Atomically store PCM for a sentence hash"""
+        self.segments_dir.mkdir(parents=True, exist_ok=True)
+        path = self._segment_path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(pcm_data)
+        os.replace(tmp_path, path)
+
+    def prune(self, keep: List[str]) -> int:
+        """Delete stored segments not in ``keep``; returns the number removed"""
+        if not self.segments_dir.is_dir():
+            return 0
+        keep_names = {f"{key}.pcm" for key in keep}
+        removed = 0
+        for entry in self.segments_dir.iterdir():
+            if entry.name not in keep_names:
+                try:
+                    entry.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
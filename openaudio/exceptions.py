@@ -20,4 +20,14 @@ class InvalidInputError(OpenAudioError):
 
 class APIError(OpenAudioError):
     """Raised when API request fails"""
-    pass
\ No newline at end of file
+    pass
+
+
+class DeadlineExceededError(OpenAudioError):
+    """Raised when a request does not complete before its deadline"""
+    pass
+
+
+class CancelledError(OpenAudioError):
+    """Raised when a request is cancelled through a CancellationToken"""
+    pass
@@ -0,0 +1,182 @@
+"""
+SSML-lite markup parsing for OpenAudio SDK
+
+Supported subset::
+
+    <speak>                                   optional root element
+    <break time="500ms"/>                     silence ("ms" or "s")
+    <break strength="strong"/>                none, x-weak, weak, medium, strong, x-strong
+    <voice name="o2">...</voice>              switch voice for the enclosed text
+    <say-as interpret-as="digits">42</say-as> cardinal, number, ordinal, digits,
+                                              characters, telephone
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Union
+
+from .exceptions import InvalidInputError
+from .models import Voice
+
+
+@dataclass(frozen=True)
+class SpeechSegment:
+    """Text to synthesize with a given voice"""
+    text: str
+    voice: Voice
+
+
+@dataclass(frozen=True)
+class BreakSegment:
+    """Silence rendered locally"""
+    duration_ms: int
+
+
+Segment = Union[SpeechSegment, BreakSegment]
+
+BREAK_STRENGTHS = {
+    "none": 0,
+    "x-weak": 100,
+    "weak": 250,
+    "medium": 500,
+    "strong": 750,
+    "x-strong": 1200,
+}
+
+MAX_BREAK_MS = 10000
+
+_TIME_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*(ms|s)\s*$')
+
+
+def _parse_break(attrs: dict) -> int:
+    """Duration in milliseconds of a <break> element"""
+    if "time" in attrs:
+        match = _TIME_PATTERN.match(attrs["time"])
+        if not match:
+            raise InvalidInputError(f"Invalid break time: {attrs['time']!r}")
+        value, unit = float(match.group(1)), match.group(2)
+        duration = int(value if unit == "ms" else value * 1000)
+    else:
+        strength = attrs.get("strength", "medium")
+        if strength not in BREAK_STRENGTHS:
+            raise InvalidInputError(f"Invalid break strength: {strength!r}")
+        duration = BREAK_STRENGTHS[strength]
+    if duration > MAX_BREAK_MS:
+        raise InvalidInputError(f"Break longer than {MAX_BREAK_MS} ms")
+    return duration
+
+
+def _ordinal(number: int) -> str:
+    """Render 1 -> 1st, 2 -> 2nd, 11 -> 11th"""
+    if 10 <= number % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(number % 10, "th")
+    return f"{number}{suffix}"
+
+
+def _say_as(text: str, interpret_as: str) -> str:
+    """Rewrite text so the model reads it as requested"""
+    text = text.strip()
+    if interpret_as in ("cardinal", "number"):
+        return re.sub(r'(?<=\d)[,_ ](?=\d{3})', '', text)
+    if interpret_as == "ordinal":
+        digits = re.sub(r'\D', '', text)
+        if not digits:
+            raise InvalidInputError(f"Invalid ordinal: {text!r}")
+        return _ordinal(int(digits))
+    if interpret_as in ("digits", "characters"):
+        return " ".join(ch for ch in text if not ch.isspace())
+    if interpret_as == "telephone":
+        groups = re.findall(r'\d+', text)
+        return ", ".join(" ".join(group) for group in groups)
+    raise InvalidInputError(f"Unsupported say-as interpret-as: {interpret_as!r}")
+
+
+def _parse_voice(name: str) -> Voice:
+    """Voice for a <voice name="..."> element"""
+    try:
+        return Voice(name.lower())
+    except ValueError:
+        raise InvalidInputError(f"Unknown voice: {name!r}")
+
+
+def parse_markup(markup: str, default_voice: Voice = Voice.O4) -> List[Segment]:
+    """
+    Parse SSML-lite markup into a segment plan
+
+    Adjacent text with the same voice is merged into a single speech segment
+    and adjacent breaks are summed.
+
+    Args:
+        markup: Markup text, with or without a <speak> root
+        default_voice: Voice used outside <voice> elements
+
+    Returns:
+        Ordered list of SpeechSegment and BreakSegment
+    """
+    from xml.etree import ElementTree  # deferred to keep package import cheap
+
+    source = markup.strip()
+    if not source.startswith("<speak"):
+        source = f"<speak>{source}</speak>"
+    try:
+        root = ElementTree.fromstring(source)
+    except ElementTree.ParseError as e:
+        raise InvalidInputError(f"Invalid markup: {e}")
+
+    plan: List[Segment] = []
+
+    def add_text(text: str, voice: Voice) -> None:
+        if not text or not text.strip():
+            if text and plan and isinstance(plan[-1], SpeechSegment):
+                plan[-1] = SpeechSegment(plan[-1].text + " ", plan[-1].voice)
+            return
+        if plan and isinstance(plan[-1], SpeechSegment) and plan[-1].voice == voice:
+            plan[-1] = SpeechSegment(plan[-1].text + text, voice)
+        else:
+            plan.append(SpeechSegment(text, voice))
+
+    def add_break(duration_ms: int) -> None:
+        if duration_ms <= 0:
+            return
+        if plan and isinstance(plan[-1], BreakSegment):
+            plan[-1] = BreakSegment(plan[-1].duration_ms + duration_ms)
+        else:
+            plan.append(BreakSegment(duration_ms))
+
+    def walk(element, voice: Voice) -> None:
+        if element.tag == "break":
+            add_break(_parse_break(element.attrib))
+        elif element.tag == "say-as":
+            if len(element):
+                raise InvalidInputError("say-as cannot contain nested elements")
+            interpret_as = element.attrib.get("interpret-as")
+            if not interpret_as:
+                raise InvalidInputError("say-as requires an interpret-as attribute")
+            add_text(_say_as(element.text or "", interpret_as), voice)
+        elif element.tag in ("speak", "voice"):
+            if element.tag == "voice":
+                if "name" not in element.attrib:
+                    raise InvalidInputError("voice requires a name attribute")
+                voice = _parse_voice(element.attrib["name"])
+            add_text(element.text or "", voice)
+            for child in element:
+                walk(child, voice)
+                add_text(child.tail or "", voice)
+        else:
+            raise InvalidInputError(f"Unsupported markup element: <{element.tag}>")
+
+    if root.tag != "speak":
+        raise InvalidInputError("Markup root element must be <speak>")
+    walk(root, default_voice)
+
+    segments: List[Segment] = []
+    for segment in plan:
+        if isinstance(segment, SpeechSegment):
+            text = " ".join(segment.text.split())
+            if not text:
+                continue
+            segment = SpeechSegment(text, segment.voice)
+        segments.append(segment)
+    return segments
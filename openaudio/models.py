@@ -49,4 +49,73 @@ class AudioResponse:
     audio_data: bytes
     format: AudioFormat
     duration: Optional[float] = None
-    text: Optional[str] = None
\ No newline at end of file
+    text: Optional[str] = None
+
+
+@dataclass
+class CacheStats:
+    """Snapshot of audio cache statistics"""
+    hits: int = 0
+    misses: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+@dataclass
+class WarmupStats:
+    """Snapshot of cache warming progress"""
+    queued: int = 0
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    prefetched: int = 0
+    
+    @property
+    def pending(self) -> int:
+        """Prompts queued but not yet processed"""
+        return self.queued - self.completed - self.skipped - self.failed
+
+
+@dataclass
+class LaneStats:
+    """Snapshot of one scheduler lane"""
+    weight: float
+    in_flight: int = 0
+    waiting: int = 0
+    granted: int = 0
+    total_wait: float = 0.0
+    
+    @property
+    def average_wait(self) -> float:
+        """Mean time in seconds a request waited for a slot"""
+        return self.total_wait / self.granted if self.granted else 0.0
+
+
+@dataclass
+class ModelStats:
+    """Rolling health statistics of one model"""
+    model: str
+    state: str
+    requests: int = 0
+    errors: int = 0
+    window_size: int = 0
+    error_rate: float = 0.0
+    p50_latency: Optional[float] = None
+    p95_latency: Optional[float] = None
+
+
+@dataclass
+class DocumentRenderResult:
+    """Outcome of an incremental document render"""
+    path: str
+    sentences: int
+    reused: int
+    synthesized: int
+    removed: int
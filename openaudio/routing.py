@@ -0,0 +1,184 @@
+"""
+Latency-aware model selection and fallback for OpenAudio SDK
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Sequence
+
+from .models import ModelStats
+
+DEFAULT_MODEL = "default"
+
+_CLOSED = "closed"        # healthy, receives traffic
+_OPEN = "open"            # unhealthy, traffic goes to fallbacks
+_HALF_OPEN = "half-open"  # unhealthy, a probe request is in flight
+
+
+def _percentile(values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[rank]
+
+
+class _ModelHealth:
+    """Rolling window and breaker state of one model"""
+
+    def __init__(self, window: int):
+        self.samples = deque(maxlen=window)  # (latency seconds, success)
+        self.state = _CLOSED
+        self.opened_at = 0.0
+        self.good_probes = 0
+        self.requests = 0
+        self.errors = 0
+
+    def latencies(self) -> List[float]:
+        return [latency for latency, _ in self.samples]
+
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+
+class ModelRouter:
+    """
+    Routes requests to a primary model and falls back when it degrades
+
+    Each model keeps a rolling window of recent request latencies and
+    outcomes. When a model's p95 latency or error rate crosses its
+    threshold (after ``min_samples`` requests), traffic moves to the next
+    healthy model in the chain. Every ``probe_interval`` seconds a single
+    request is sent to the degraded model as a probe, and after
+    ``recovery_probes`` consecutive fast, successful probes it takes traffic
+    again.
+    """
+
+    def __init__(self,
+                 primary: str = DEFAULT_MODEL,
+                 fallbacks: Sequence[str] = (),
+                 p95_threshold: float = 15.0,
+                 error_rate_threshold: float = 0.5,
+                 window: int = 50,
+                 min_samples: int = 10,
+                 probe_interval: float = 30.0,
+                 recovery_probes: int = 3):
+        """
+        Initialize model router
+
+        Args:
+            primary: Preferred model ("default" for the built-in model)
+            fallbacks: Models to use, in order, while the primary is degraded
+            p95_threshold: p95 latency in seconds above which a model degrades
+            error_rate_threshold: Error rate (0-1) above which a model degrades
+            window: Number of recent requests tracked per model
+            min_samples: Requests required before a model can degrade
+            probe_interval: Seconds between probes of a degraded model
+            recovery_probes: Consecutive good probes needed to recover
+        """
+        if window < 1 or min_samples < 1 or recovery_probes < 1:
+            raise ValueError("window, min_samples and recovery_probes must be at least 1")
+        if not 0.0 < error_rate_threshold <= 1.0:
+            raise ValueError("error_rate_threshold must be between 0 and 1")
+
+        self.chain = list(dict.fromkeys([primary, *fallbacks]))
+        self.p95_threshold = p95_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min(min_samples, window)
+        self.probe_interval = probe_interval
+        self.recovery_probes = recovery_probes
+        self._window = window
+        self._health: Dict[str, _ModelHealth] = {m: _ModelHealth(window) for m in self.chain}
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        """Replace the lock, which may have been held by a parent thread"""
+        self._lock = threading.Lock()
+
+    @property
+    def primary(self) -> str:
+        return self.chain[0]
+
+    def select(self, exclude: Sequence[str] = ()) -> Optional[str]:
+        """
+        Pick the model for the next request
+
+        Returns the first model in the chain that is healthy or due for a
+        probe, falling back to the last untried model if all are degraded.
+        Returns None when every model is excluded.
+        """
+        now = time.monotonic()
+        with self._lock:
+            candidates = [m for m in self.chain if m not in exclude]
+            for model in candidates:
+                health = self._health[model]
+                if health.state == _CLOSED:
+                    return model
+                # A half-open model whose probe never reported back is probed again
+                if now - health.opened_at >= self.probe_interval:
+                    health.state = _HALF_OPEN
+                    health.opened_at = now
+                    return model
+            return candidates[-1] if candidates else None
+
+    def record(self, model: str, latency: float, success: bool) -> None:
+        """Record the outcome of a request"""
+        with self._lock:
+            health = self._health.get(model)
+            if health is None:
+                health = self._health[model] = _ModelHealth(self._window)
+            health.requests += 1
+            if not success:
+                health.errors += 1
+
+            if health.state == _HALF_OPEN:
+                if success and latency <= self.p95_threshold:
+                    health.good_probes += 1
+                    if health.good_probes >= self.recovery_probes:
+                        health.state = _CLOSED
+                        health.samples.clear()
+                        health.good_probes = 0
+                    else:
+                        health.state = _OPEN
+                        health.opened_at = 0.0  # probe again right away
+                else:
+                    health.state = _OPEN
+                    health.opened_at = time.monotonic()
+                    health.good_probes = 0
+                return
+
+            health.samples.append((latency, success))
+            if health.state == _CLOSED and self._degraded(health):
+                health.state = _OPEN
+                health.opened_at = time.monotonic()
+
+    def _degraded(self, health: _ModelHealth) -> bool:
+        """Whether a model's window crosses a threshold (lock held)"""
+        if len(health.samples) < self.min_samples:
+            return False
+        if health.error_rate() > self.error_rate_threshold:
+            return True
+        p95 = _percentile(health.latencies(), 0.95)
+        return p95 is not None and p95 > self.p95_threshold
+
+    def stats(self) -> Dict[str, ModelStats]:
+        """Return per-model statistics"""
+        with self._lock:
+            return {
+                model: ModelStats(
+                    model=model,
+                    state=health.state,
+                    requests=health.requests,
+                    errors=health.errors,
+                    window_size=len(health.samples),
+                    error_rate=health.error_rate(),
+                    p50_latency=_percentile(health.latencies(), 0.5),
+                    p95_latency=_percentile(health.latencies(), 0.95)
+                )
+                for model, health in self._health.items()
+            }
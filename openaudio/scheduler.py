@@ -0,0 +1,222 @@
+"""
+Priority lanes and weighted fair scheduling for OpenAudio SDK
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional
+
+from .cancellation import _Budget, _Lease
+from .exceptions import InvalidInputError
+from .models import LaneStats, Voice
+
+
+class _Waiter:
+    """A request waiting for a concurrency slot"""
+    
+    __slots__ = ("lane", "voice", "granted", "enqueued", "generation")
+    
+    def __init__(self, lane: str, voice: Optional[Voice], generation: int):
+        self.lane = lane
+        self.voice = voice
+        self.granted = False
+        self.generation = generation
+        self.enqueued = time.monotonic()
+
+
+class _Lane:
+    """Per-lane queue and accounting"""
+    
+    def __init__(self, weight: float):
+        self.weight = weight
+        self.queue = deque()
+        self.virtual_time = 0.0
+        self.stats = LaneStats(weight=weight)
+
+
+class Scheduler:
+    """
+    Shares a global concurrency budget between named priority lanes
+    
+    Each lane receives slots in proportion to its weight while it has
+    waiting requests (weighted fair queuing), and idle capacity is always
+    handed to whichever lane is waiting. Optional per-voice caps limit how
+    many requests for one voice run at the same time.
+    """
+    
+    DEFAULT_LANES = {"interactive": 8.0, "bulk": 1.0}
+    
+    def __init__(self,
+                 max_concurrency: int = 8,
+                 lanes: Optional[Mapping[str, float]] = None,
+                 voice_limits: Optional[Mapping[Voice, int]] = None,
+                 default_lane: Optional[str] = None):
+        """
+        Initialize scheduler
+        
+        Args:
+            max_concurrency: Total requests allowed in flight across all lanes
+            lanes: Mapping of lane name to weight (default interactive=8, bulk=1)
+            voice_limits: Optional maximum concurrent requests per voice
+            default_lane: Lane used when a request names none (default:
+                the highest weight lane)
+        """
+        lanes = dict(lanes or self.DEFAULT_LANES)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if not lanes or any(weight <= 0 for weight in lanes.values()):
+            raise ValueError("Lane weights must be positive")
+        
+        self.max_concurrency = max_concurrency
+        self.voice_limits = dict(voice_limits or {})
+        self.default_lane = default_lane or max(lanes, key=lanes.get)
+        self.background_lane = min(lanes, key=lanes.get)
+        if self.default_lane not in lanes:
+            raise ValueError(f"Unknown default lane: {self.default_lane}")
+        
+        self._lanes: Dict[str, _Lane] = {name: _Lane(w) for name, w in lanes.items()}
+        self._in_flight = 0
+        self._voice_in_flight: Dict[Voice, int] = {}
+        self._generation = 0
+        self._cond = threading.Condition()
+    
+    @contextmanager
+    def slot(self,
+             lane: Optional[str] = None,
+             voice: Optional[Voice] = None,
+             budget: Optional[_Budget] = None) -> Iterator[None]:
+        """
+        Hold a concurrency slot for the duration of the block
+        
+        Args:
+            lane: Lane name (default lane if omitted)
+            voice: Voice of the request, for per-voice caps
+            budget: Optional deadline/cancellation budget for the wait
+        """
+        waiter = self._acquire(lane or self.default_lane, voice, budget)
+        try:
+            yield
+        finally:
+            self._release(waiter)
+    
+    def _lease(self,
+               lane: Optional[str] = None,
+               voice: Optional[Voice] = None,
+               budget: Optional[_Budget] = None) -> _Lease:
+        """Acquire a slot held until every holder of the lease releases it"""
+        waiter = self._acquire(lane or self.default_lane, voice, budget)
+        return _Lease(lambda: self._release(waiter))
+    
+    def stats(self) -> Dict[str, LaneStats]:
+        """Return a snapshot of per-lane statistics"""
+        with self._cond:
+            return {
+                name: LaneStats(**vars(state.stats))
+                for name, state in self._lanes.items()
+            }
+    
+    def _after_fork(self) -> None:
+        """Forget slots and waiters belonging to the parent process"""
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._voice_in_flight = {}
+        self._generation += 1
+        for state in self._lanes.values():
+            state.queue.clear()
+            state.stats.in_flight = 0
+            state.stats.waiting = 0
+    
+    def _acquire(self, lane: str, voice: Optional[Voice], budget: Optional[_Budget]) -> _Waiter:
+        """Queue a waiter and block until it is granted a slot"""
+        state = self._lanes.get(lane)
+        if state is None:
+            raise InvalidInputError(f"Unknown scheduler lane: {lane}")
+        budget = budget or _Budget()
+        token = budget.cancel_token
+        
+        with self._cond:
+            waiter = _Waiter(lane, voice, self._generation)
+            if not state.queue:
+                # A lane returning from idle must not spend credit banked while idle
+                active = [s.virtual_time for s in self._lanes.values() if s.queue]
+                if active:
+                    state.virtual_time = max(state.virtual_time, min(active))
+            state.queue.append(waiter)
+            state.stats.waiting += 1
+            self._dispatch()
+        
+        if token is not None:
+            token._add_callback(self._wake)
+        try:
+            with self._cond:
+                while not waiter.granted:
+                    try:
+                        budget.check("scheduling")
+                    except BaseException:
+                        state.queue.remove(waiter)
+                        state.stats.waiting -= 1
+                        self._dispatch()
+                        raise
+                    self._cond.wait(budget.remaining())
+        finally:
+            if token is not None:
+                token._remove_callback(self._wake)
+        return waiter
+    
+    def _release(self, waiter: _Waiter) -> None:
+        """Return a slot and hand it to the next eligible waiter"""
+        with self._cond:
+            if waiter.generation != self._generation:
+                # Granted before a fork; the slot was already forgotten
+                return
+            self._in_flight -= 1
+            self._lanes[waiter.lane].stats.in_flight -= 1
+            if waiter.voice is not None and waiter.voice in self._voice_in_flight:
+                self._voice_in_flight[waiter.voice] -= 1
+            self._dispatch()
+    
+    def _wake(self) -> None:
+        """Wake waiters so they re-check cancellation"""
+        with self._cond:
+            self._cond.notify_all()
+    
+    def _voice_available(self, voice: Optional[Voice]) -> bool:
+        """Whether another request for this voice may start (lock held)"""
+        limit = self.voice_limits.get(voice)
+        return limit is None or self._voice_in_flight.get(voice, 0) < limit
+    
+    def _dispatch(self) -> None:
+        """Grant free slots to waiters in weighted fair order (lock held)"""
+        granted = False
+        while self._in_flight < self.max_concurrency:
+            best = None
+            best_waiter = None
+            for state in self._lanes.values():
+                if best is not None and state.virtual_time >= best.virtual_time:
+                    continue
+                # First waiter in this lane whose voice is under its cap
+                eligible = next(
+                    (w for w in state.queue if self._voice_available(w.voice)), None
+                )
+                if eligible is not None:
+                    best, best_waiter = state, eligible
+            if best is None:
+                break
+            
+            best.queue.remove(best_waiter)
+            best.virtual_time += 1.0 / best.weight
+            best.stats.waiting -= 1
+            best.stats.in_flight += 1
+            best.stats.granted += 1
+            best.stats.total_wait += time.monotonic() - best_waiter.enqueued
+            if best_waiter.voice is not None and best_waiter.voice in self.voice_limits:
+                self._voice_in_flight[best_waiter.voice] = \
+                    self._voice_in_flight.get(best_waiter.voice, 0) + 1
+            best_waiter.granted = True
+            self._in_flight += 1
+            granted = True
+        
+        if granted:
+            self._cond.notify_all()
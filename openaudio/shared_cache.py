@@ -0,0 +1,418 @@
+"""
+Cross-process shared-memory audio cache for OpenAudio SDK
+"""
+
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import OpenAudioError
+from .models import CacheStats
+
+_MAGIC = b'OAUDSHM1'
+_VERSION = 1
+_HEADER = struct.Struct('<8sIIQ')      # magic, version, max_entries, data_size
+_HEADER_SIZE = 64
+_KEY_SIZE = 16
+_RECORD = struct.Struct('<IIQQd')      # writer pid, reserved, offset, length, last access
+_FREE, _WRITING, _READY = 0, 1, 2
+
+
+def _align(value: int, boundary: int) -> int:
+    """Round value up to a multiple of boundary"""
+    return (value + boundary - 1) // boundary * boundary
+
+
+def _default_path() -> str:
+    """Arena location shared by all processes of the current user"""
+    import tempfile  # deferred to keep package import cheap
+
+    base = '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(base, f'openaudio-cache-{uid}')
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this PID exists"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedAudioCache:
+    """
+    LRU audio cache stored in a memory-mapped file shared between processes
+
+    All processes on a host that open the same ``path`` see each other's
+    entries. The arena has a fixed number of index slots and a fixed data
+    region, so total memory is bounded by ``max_bytes``. Each index slot is
+    guarded by its own byte-range lock: readers hold it shared while copying
+    the audio out and writers only need it exclusively to evict that entry.
+    Allocation is serialized by a separate arena lock, and entries being read
+    by threads of this process are pinned so they are never evicted from
+    under them. Entries are written
+    in a ``writing`` state and only published once complete, and slots left
+    in that state by a process that died are reclaimed on the next
+    allocation.
+
+    Open the arena once per process; POSIX record locks are released when
+    any descriptor of the file is closed by that process.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 max_entries: int = 4096):
+        """
+        Open or create a shared cache arena
+
+        Args:
+            path: Arena file (default: a per-user file in /dev/shm)
+            max_bytes: Size of the audio data region
+            max_entries: Number of index slots
+        """
+        try:
+            import fcntl
+        except ImportError:
+            raise OpenAudioError("SharedAudioCache requires a POSIX platform")
+        if max_bytes <= 0 or max_entries <= 0:
+            raise ValueError("max_bytes and max_entries must be positive")
+
+        self._fcntl = fcntl
+        self.path = path or _default_path()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+
+        self._states_off = _HEADER_SIZE
+        self._keys_off = self._states_off + _align(max_entries, 8)
+        self._records_off = self._keys_off + _KEY_SIZE * max_entries
+        self._data_off = _align(self._records_off + _RECORD.size * max_entries, 64)
+        self._total_size = self._data_off + max_bytes
+
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._pins: Dict[int, int] = {}
+
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, 'O_NOFOLLOW', 0)
+        self._fd = os.open(self.path, flags, 0o600)
+        try:
+            self._check_owner()
+            with self._arena_lock():
+                self._init_arena()
+            self._mm = mmap.mmap(self._fd, self._total_size)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def _check_owner(self) -> None:
+        """Refuse arenas another user could have planted or can write to"""
+        import stat
+
+        info = os.fstat(self._fd)
+        if not stat.S_ISREG(info.st_mode):
+            raise OpenAudioError(f"Cache arena {self.path} is not a regular file")
+        if info.st_uid != os.getuid() or info.st_mode & 0o077:
+            raise OpenAudioError(
+                f"Cache arena {self.path} must be owned by the current user "
+                "and not accessible to group or others"
+            )
+
+    def _init_arena(self) -> None:
+        """Initialize a new arena file or validate an existing one"""
+        size = os.fstat(self._fd).st_size
+        geometry = (_VERSION, self.max_entries, self.max_bytes)
+        if size >= _HEADER.size:
+            magic, *existing = _HEADER.unpack(os.pread(self._fd, _HEADER.size, 0))
+            if magic == _MAGIC:
+                if tuple(existing) != geometry:
+                    raise ValueError(
+                        f"Existing cache arena at {self.path} has a different size; "
+                        "remove it or open it with matching max_bytes/max_entries"
+                    )
+                return
+        os.ftruncate(self._fd, 0)
+        os.ftruncate(self._fd, self._total_size)
+        os.pwrite(self._fd, _HEADER.pack(_MAGIC, *geometry), 0)
+
+    def _state(self, index: int) -> int:
+        return self._mm[self._states_off + index]
+
+    def _set_state(self, index: int, state: int) -> None:
+        self._mm[self._states_off + index] = state
+
+    def _record(self, index: int) -> Tuple[int, int, int, int, float]:
+        return _RECORD.unpack_from(self._mm, self._records_off + index * _RECORD.size)
+
+    def _set_record(self, index: int, pid: int, offset: int, length: int, last_access: float) -> None:
+        _RECORD.pack_into(self._mm, self._records_off + index * _RECORD.size,
+                          pid, 0, offset, length, last_access)
+
+    def _touch(self, index: int) -> None:
+        """Update the LRU timestamp of an entry"""
+        struct.pack_into('<d', self._mm, self._records_off + index * _RECORD.size + 24, time.time())
+
+    def _set_key(self, index: int, digest: bytes) -> None:
+        start = self._keys_off + index * _KEY_SIZE
+        self._mm[start:start + _KEY_SIZE] = digest
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        """Fixed-size index key"""
+        import hashlib
+
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=_KEY_SIZE).digest()
+
+    def _find(self, digest: bytes) -> Iterator[int]:
+        """Yield index slots whose stored key matches digest"""
+        keys_end = self._keys_off + _KEY_SIZE * self.max_entries
+        position = self._mm.find(digest, self._keys_off, keys_end)
+        while position != -1:
+            relative = position - self._keys_off
+            if relative % _KEY_SIZE == 0:
+                yield relative // _KEY_SIZE
+            position = self._mm.find(digest, position + 1, keys_end)
+
+    @contextmanager
+    def _arena_lock(self) -> Iterator[None]:
+        """Exclusive lock serializing allocation across processes"""
+        with self._lock:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_EX, 1, 0, os.SEEK_SET)
+            try:
+                yield
+            finally:
+                self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, 1, 0, os.SEEK_SET)
+
+    @contextmanager
+    def _entry_lock(self, index: int, exclusive: bool = False) -> Iterator[None]:
+        """Lock a single index slot"""
+        mode = self._fcntl.LOCK_EX if exclusive else self._fcntl.LOCK_SH
+        start = self._states_off + index
+        self._fcntl.lockf(self._fd, mode, 1, start, os.SEEK_SET)
+        try:
+            yield
+        finally:
+            self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, 1, start, os.SEEK_SET)
+
+    def __contains__(self, key: str) -> bool:
+        digest = self._digest(key)
+        with self._lock:
+            return any(self._state(i) == _READY for i in self._find(digest))
+
+    def __len__(self) -> int:
+        with self._lock:
+            states = self._mm[self._states_off:self._states_off + self.max_entries]
+            return states.count(_READY)
+
+    @contextmanager
+    def view(self, key: str) -> Iterator[Optional[memoryview]]:
+        """
+        Zero-copy access to a cached entry
+
+        Yields a memoryview into the shared arena (or None on a miss) that is
+        only valid inside the ``with`` block. The entry stays pinned for the
+        whole block, so it cannot be evicted, but other threads and
+        processes can keep using the cache meanwhile.
+        """
+        index = self._pin(self._digest(key))
+        if index is None:
+            yield None
+            return
+        try:
+            # A pinned slot's record cannot change until it is unpinned
+            _, _, offset, length, _ = self._record(index)
+            start = self._data_off + offset
+            view = memoryview(self._mm)[start:start + length]
+            try:
+                yield view
+            finally:
+                view.release()
+        finally:
+            self._unpin(index)
+
+    def _pin(self, digest: bytes) -> Optional[int]:
+        """Find a ready entry and protect it from eviction, counting the lookup"""
+        with self._lock:
+            for index in self._find(digest):
+                if index not in self._pins:
+                    # Shared entry lock keeps other processes from freeing it
+                    start = self._states_off + index
+                    self._fcntl.lockf(self._fd, self._fcntl.LOCK_SH, 1, start, os.SEEK_SET)
+                    # Re-check under the entry lock; it may have been evicted
+                    key_start = self._keys_off + index * _KEY_SIZE
+                    if self._state(index) != _READY or self._mm[key_start:key_start + _KEY_SIZE] != digest:
+                        self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, 1, start, os.SEEK_SET)
+                        continue
+                self._pins[index] = self._pins.get(index, 0) + 1
+                self._touch(index)
+                self._hits += 1
+                return index
+            self._misses += 1
+            return None
+
+    def _unpin(self, index: int) -> None:
+        """Drop a pin taken by _pin, releasing the entry lock with the last one"""
+        with self._lock:
+            self._pins[index] -= 1
+            if self._pins[index] == 0:
+                del self._pins[index]
+                start = self._states_off + index
+                self._fcntl.lockf(self._fd, self._fcntl.LOCK_UN, 1, start, os.SEEK_SET)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return cached PCM data for key, or None on a miss"""
+        with self.view(key) as view:
+            return None if view is None else bytes(view)
+
+    def put(self, key: str, pcm_data: bytes) -> None:
+        """Store PCM data, evicting least recently used entries as needed"""
+        length = len(pcm_data)
+        if length == 0 or length > self.max_bytes:
+            return
+        digest = self._digest(key)
+
+        with self._lock:
+            with self._arena_lock():
+                for index in self._find(digest):
+                    if self._state(index) in (_WRITING, _READY):
+                        # Already stored or being stored by another process
+                        self._touch(index)
+                        return
+                slot = self._allocate(length)
+                if slot is None:
+                    return
+                index, offset = slot
+                self._set_record(index, os.getpid(), offset, length, time.time())
+                self._set_key(index, digest)
+                self._set_state(index, _WRITING)
+
+            # Copy outside the arena lock; the slot is reserved in writing state
+            start = self._data_off + offset
+            try:
+                self._mm[start:start + length] = pcm_data
+            except BaseException:
+                with self._arena_lock():
+                    self._free(index)
+                raise
+            self._set_state(index, _READY)
+
+    def _allocate(self, length: int) -> Optional[Tuple[int, int]]:
+        """Reserve an index slot and a data range (arena lock held)"""
+        self._reclaim_dead_writers()
+        while True:
+            used: List[Tuple[int, int]] = []
+            free_index = None
+            for index in range(self.max_entries):
+                state = self._state(index)
+                if state == _FREE:
+                    if free_index is None:
+                        free_index = index
+                    continue
+                _, _, offset, entry_length, _ = self._record(index)
+                used.append((offset, entry_length))
+
+            offset = self._first_fit(sorted(used), length)
+            if free_index is not None and offset is not None:
+                return free_index, offset
+            if not self._evict_lru():
+                return None
+
+    def _first_fit(self, used: List[Tuple[int, int]], length: int) -> Optional[int]:
+        """First gap in the data region large enough for length bytes"""
+        position = 0
+        for offset, entry_length in used:
+            if offset - position >= length:
+                return position
+            position = max(position, offset + entry_length)
+        if self.max_bytes - position >= length:
+            return position
+        return None
+
+    def _evict_lru(self) -> bool:
+        """Free the least recently used ready entry (arena lock held)"""
+        victim = None
+        oldest = None
+        for index in range(self.max_entries):
+            # Entries pinned by this process's readers cannot be evicted
+            if self._state(index) != _READY or index in self._pins:
+                continue
+            last_access = self._record(index)[4]
+            if oldest is None or last_access < oldest:
+                victim, oldest = index, last_access
+        if victim is None:
+            return False
+        self._free(victim)
+        self._evictions += 1
+        return True
+
+    def _free(self, index: int) -> None:
+        """Release an index slot once no reader holds it"""
+        with self._entry_lock(index, exclusive=True):
+            self._set_state(index, _FREE)
+            self._set_key(index, bytes(_KEY_SIZE))
+
+    def _reclaim_dead_writers(self) -> None:
+        """Free slots left in writing state by processes that died"""
+        states = self._mm[self._states_off:self._states_off + self.max_entries]
+        index = states.find(_WRITING)
+        while index != -1:
+            pid = self._record(index)[0]
+            if pid != os.getpid() and not _pid_alive(pid):
+                self._free(index)
+            index = states.find(_WRITING, index + 1)
+
+    def clear(self) -> None:
+        """Remove all entries except those currently being read"""
+        with self._lock:
+            with self._arena_lock():
+                for index in range(self.max_entries):
+                    if self._state(index) == _READY and index not in self._pins:
+                        self._free(index)
+
+    def stats(self) -> CacheStats:
+        """
+        Return cache statistics
+
+        Entry count and size cover the whole arena; hits, misses and
+        evictions are counted for this process only.
+        """
+        with self._lock:
+            size = 0
+            entries = 0
+            for index in range(self.max_entries):
+                if self._state(index) == _READY:
+                    entries += 1
+                    size += self._record(index)[3]
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                entries=entries,
+                size_bytes=size,
+                evictions=self._evictions
+            )
+
+    def close(self) -> None:
+        """Unmap the arena; entries remain available to other processes"""
+        with self._lock:
+            if self._fd >= 0:
+                self._mm.close()
+                os.close(self._fd)
+                self._fd = -1
+
+    def _after_fork(self) -> None:
+        """Reset process-local state; the mapping itself is inherited"""
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Record locks are not inherited, so pins taken by the parent are gone
+        self._pins = {}
@@ -0,0 +1,93 @@
+"""
+Prompt templates with cached static segments for OpenAudio SDK
+"""
+
+from string import Formatter
+from typing import Any, List, Mapping, Optional, Tuple
+
+from .exceptions import InvalidInputError
+
+
+class PromptTemplate:
+    """
+    Prompt with static text and named slots, e.g.
+    ``"Your order {id} will arrive on {date}"``
+
+    When rendered through ``OpenAudioClient.generate_from_template`` the
+    static parts are synthesized once per voice and cached, so each new set
+    of slot values only costs the synthesis of the values themselves.
+    """
+
+    def __init__(self, template: str, crossfade_ms: int = 15):
+        """
+        Initialize prompt template
+
+        Args:
+            template: Template text using ``str.format`` style named slots
+            crossfade_ms: Crossfade applied at each join between pieces
+        """
+        if not template or not template.strip():
+            raise InvalidInputError("Template cannot be empty")
+        if crossfade_ms < 0:
+            raise InvalidInputError("crossfade_ms cannot be negative")
+
+        self.template = template
+        self.crossfade_ms = crossfade_ms
+        # (literal text, None) for static parts, (slot name, format string) for slots
+        self._parts: List[Tuple[str, Optional[str]]] = []
+        slots = []
+        try:
+            parsed = list(Formatter().parse(template))
+        except ValueError as e:
+            raise InvalidInputError(f"Invalid template: {e}")
+
+        for literal, field, format_spec, conversion in parsed:
+            if literal:
+                self._parts.append((literal, None))
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise InvalidInputError(f"Template slots must be named: {{{field}}}")
+            if conversion not in (None, "r", "s", "a"):
+                raise InvalidInputError(f"Invalid conversion in template slot {field}: !{conversion}")
+            spec = f"{{0{'!' + conversion if conversion else ''}{':' + format_spec if format_spec else ''}}}"
+            self._parts.append((field, spec))
+            slots.append(field)
+        self.slots = tuple(dict.fromkeys(slots))
+
+    def __repr__(self) -> str:
+        return f"PromptTemplate({self.template!r})"
+
+    def render_parts(self, values: Mapping[str, Any]) -> List[Tuple[str, bool]]:
+        """
+        Split the template into pieces for the given slot values
+
+        Returns:
+            List of ``(text, is_static)`` pairs. Pieces without any letters
+            or digits (pure whitespace or punctuation) are dropped since
+            they produce no speech on their own.
+        """
+        missing = [slot for slot in self.slots if slot not in values]
+        if missing:
+            raise InvalidInputError(f"Missing template values: {', '.join(missing)}")
+
+        pieces = []
+        for text, spec in self._parts:
+            is_static = spec is None
+            if not is_static:
+                try:
+                    text = spec.format(values[text])
+                except (ValueError, TypeError, KeyError, IndexError) as e:
+                    raise InvalidInputError(f"Cannot format template slot {text}: {e}")
+            text = " ".join(text.split())
+            if is_static:
+                # Punctuation closing the previous slot cannot be spoken on its own
+                text = text.lstrip(",.;:")
+                text = text.strip()
+            if any(ch.isalnum() for ch in text):
+                pieces.append((text, is_static))
+        return pieces
+
+    def format(self, values: Mapping[str, Any]) -> str:
+        """Full text of the prompt for the given slot values"""
+        return self.template.format(**values)
@@ -0,0 +1,170 @@
+"""
+Background cache warming and speculative prefetch for OpenAudio SDK
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
+
+from .models import VoiceOptions, WarmupStats
+
+if TYPE_CHECKING:
+    from .client import OpenAudioClient
+
+
+class CacheWarmer:
+    """
+    Synthesizes prompts into a client's cache on a background thread
+
+    Work is processed highest priority first and throttled to ``rate``
+    requests per second so warming never competes with live traffic for the
+    whole request quota. Prompts that are already cached are skipped.
+    """
+
+    def __init__(self, client: "OpenAudioClient", rate: float = 2.0):
+        """
+        Initialize cache warmer
+
+        Args:
+            client: Client whose cache is warmed
+            rate: Maximum synthesis requests started per second
+        """
+        self._client = client
+        self.rate = rate
+        self._queue = []
+        self._queued_keys = set()
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._stats = WarmupStats()
+        self._in_progress = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    @property
+    def rate(self) -> float:
+        """Maximum synthesis requests started per second"""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = value
+
+    def submit(self,
+               text: str,
+               voice_options: Optional[VoiceOptions] = None,
+               system_prompt: Optional[str] = None,
+               priority: int = 0,
+               prefetch: bool = False) -> bool:
+        """
+        Queue a prompt for warming
+
+        Args:
+            text: Prompt text
+            voice_options: Voice configuration options
+            system_prompt: Optional system instruction
+            priority: Higher values are synthesized first
+            prefetch: Count the prompt as a speculative prefetch
+
+        Returns:
+            True if the prompt was queued, False if already cached or queued
+        """
+        voice_options = voice_options or VoiceOptions()
+        key = self._client._cache_key_for(text, voice_options, system_prompt)
+        if key in self._client.cache:
+            return False
+
+        with self._cond:
+            if self._stopped or key in self._queued_keys:
+                return False
+            self._queued_keys.add(key)
+            heapq.heappush(
+                self._queue,
+                (-priority, next(self._counter), key, text, voice_options, system_prompt)
+            )
+            self._stats.queued += 1
+            if prefetch:
+                self._stats.prefetched += 1
+            self._ensure_thread()
+            self._cond.notify()
+        return True
+
+    def stats(self) -> WarmupStats:
+        """Return a snapshot of warming progress"""
+        with self._cond:
+            return WarmupStats(**vars(self._stats))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued prompts are processed; returns False on timeout"""
+        end = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._in_progress:
+                remaining = None if end is None else end - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self) -> None:
+        """Discard queued work and stop the background thread"""
+        with self._cond:
+            self._stopped = True
+            self._queue.clear()
+            self._queued_keys.clear()
+            self._cond.notify_all()
+
+    def _ensure_thread(self) -> None:
+        """Start the worker thread if it is not running (lock held)"""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="openaudio-warmer", daemon=True
+            )
+            self._thread.start()
+
+    def _lane(self) -> Optional[str]:
+        """Warming runs in the scheduler's lowest priority lane"""
+        scheduler = self._client.scheduler
+        return scheduler.background_lane if scheduler is not None else None
+
+    def _run(self) -> None:
+        """Worker loop: pop the highest priority prompt and synthesize it"""
+        next_start = time.monotonic()
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+
+                delay = next_start - time.monotonic()
+                if delay > 0:
+                    # Throttle, but wake early if stopped
+                    self._cond.wait(delay)
+                    continue
+
+                _, _, key, text, voice_options, system_prompt = heapq.heappop(self._queue)
+                self._in_progress += 1
+
+            outcome = "failed"
+            try:
+                next_start = time.monotonic() + 1.0 / self.rate
+                if key in self._client.cache:
+                    outcome = "skipped"
+                else:
+                    # Bypass cache lookups so warming does not skew hit rates
+                    pcm_data = self._client._request_pcm(
+                        text, voice_options, system_prompt, lane=self._lane()
+                    )
+                    self._client.cache.put(key, pcm_data)
+                    outcome = "completed"
+            except Exception:
+                pass
+            finally:
+                with self._cond:
+                    self._in_progress -= 1
+                    self._queued_keys.discard(key)
+                    setattr(self._stats, outcome, getattr(self._stats, outcome) + 1)
+                    self._cond.notify_all()